@@ -1,93 +1,413 @@
 # Backend client class for interacting with the Place Scraper API
 import os
 import json
+import mmap
+import socket
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import orjson
 import requests
-from typing import Optional, List, Dict, Any
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+from typing import Optional, List, Dict, Tuple, Any, Iterable, Iterator, NamedTuple
 from dotenv import load_dotenv
 load_dotenv()
 
+BOUNDS_BOX_DISTANCE: float = 0.001  # ~100 meters around the point
+BOUNDS_CACHE_SIZE: int = 1024
+PLACE_CACHE_MAX_ENTRIES: int = 10_000  # most recently validated place responses kept in memory and on disk
+
+# Consecutive outage responses (after urllib3's own retries) that open the circuit, and how long it stays open.
+# A plain 500 is left out: for this backend it means one broken place, which callers act on.
+BREAKER_FAILURE_THRESHOLD: int = 5
+BREAKER_COOLDOWN_SECONDS: float = 30.0
+BREAKER_STATUS_CODES: frozenset = frozenset({502, 503, 504})
+
+# Decimal places coordinates are compared at (~0.1 m), so float noise doesn't break an exact-location match
+COORD_MATCH_DECIMALS: int = 6
+
+def iter_json_paths(directory: str) -> Iterator[str]:
+    """Yield every .json file under a directory as it's found (scandir entries carry their file type, so no extra stat calls)."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_json_paths(entry.path)
+            elif entry.name.endswith(".json") and entry.is_file():
+                yield entry.path
+
+class _BoundsTile(NamedTuple):
+    """Places returned by one bounds query, indexed for constant-time matching."""
+    places: Tuple[Dict[str, Any], ...]
+    ids_by_coords: Dict[Tuple[float, float], Any]
+    ids_by_name: Dict[str, Any]
+
+def _coords_key(latitude: Any, longitude: Any) -> Optional[Tuple[float, float]]:
+    """Rounded (latitude, longitude) used to match places by location, or None if either is not a number."""
+    if isinstance(latitude, (int, float)) and isinstance(longitude, (int, float)):
+        return (round(latitude, COORD_MATCH_DECIMALS), round(longitude, COORD_MATCH_DECIMALS))
+    return None
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised without any network call while the backend circuit breaker is open."""
+
+class _CircuitBreaker:
+    """Fail fast once the backend looks down; after the cooldown a single probe request decides whether to close again."""
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURE_THRESHOLD, cooldown: float = BREAKER_COOLDOWN_SECONDS) -> None:
+        self.failure_threshold: int = failure_threshold
+        self.cooldown: float = cooldown
+        self._lock: threading.Lock = threading.Lock()
+        self._failure_count: int = 0
+        self._opened_at: Optional[float] = None  # None while closed
+        self._probing: bool = False  # half-open: the one probe request is in flight
+
+    def before_request(self) -> None:
+        """Let a request through, or raise CircuitOpenError if the circuit is open."""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if self._probing or time.monotonic() - self._opened_at < self.cooldown:
+                raise CircuitOpenError(f"Backend circuit open after {self._failure_count} consecutive failures")
+            self._probing = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failure_count = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failure_count += 1
+            # A failed probe re-opens immediately; otherwise open once the threshold is reached
+            if self._probing or self._failure_count >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+    def release_probe(self) -> None:
+        """End an in-flight probe without an outcome, so the next request after the cooldown probes again."""
+        with self._lock:
+            self._probing = False
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose sockets also enable TCP keepalive, so idle pooled connections aren't silently dropped."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        # urllib3's defaults already include TCP_NODELAY; keep them and add SO_KEEPALIVE
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        super().init_poolmanager(*args, **kwargs)
+
 class BackendClient:
     """A client for interacting with the backend API for place management."""
     
-    def __init__(self, api_url: Optional[str] = None) -> None:
+    def __init__(self, api_url: Optional[str] = None, pool_maxsize: int = 64) -> None:
         """Initialize the backend client with API URL."""
         self.api_url: Optional[str] = api_url or os.getenv("BACKEND_API_URL")
         if not self.api_url:
             raise ValueError("BACKEND_API_URL must be provided either as parameter or environment variable")
+
+        # Base of every places endpoint, built once rather than per request
+        self._places_url: str = f"{self.api_url}/api/places"
+        self._places_bulk_url: str = f"{self._places_url}/bulk"
+
+        # Shared session so repeated calls reuse keep-alive connections instead of reconnecting.
+        # Connection errors, rate limiting and gateway errors are retried with capped, jittered exponential backoff
+        # (so concurrent workers don't retry in lockstep); 404/500 are meaningful to callers (backend_CLI acts on them).
+        # POST isn't in Retry's default allowed_methods, so creates are never sent twice.
+        self.session: requests.Session = requests.Session()
+        self.session.headers.update({"Accept": "application/json"})
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            backoff_max=30,
+            backoff_jitter=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            raise_on_status=False
+        )
+        # Non-blocking pool: bursts beyond pool_maxsize open extra connections instead of waiting for a free one
+        adapter = _KeepAliveAdapter(pool_connections=16, pool_maxsize=pool_maxsize, pool_block=False, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Shared by every thread using this client, so one outage stops all of them
+        self._breaker: _CircuitBreaker = _CircuitBreaker()
+
+        # Whether the backend has the bulk promotions endpoint; None until a bulk request finds out
+        self.promotions_bulk_supported: Optional[bool] = None
+
+        # Last validated 200 response per place id, revalidated with conditional GETs
+        self._place_cache: Dict[int, requests.Response] = {}
+        self._place_cache_lock: threading.Lock = threading.Lock()
+
+        # Bounds lookups by quantized point (LRU); writes drop only the tiles they can affect.
+        # The generation counter stops a lookup that raced a write from caching its stale result.
+        self._bounds_cache: "OrderedDict[Tuple[float, float], _BoundsTile]" = OrderedDict()
+        self._bounds_lock: threading.Lock = threading.Lock()
+        self._bounds_generation: int = 0
+
+    def __enter__(self) -> "BackendClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def warm_up(self) -> None:
+        """Resolve the backend host and open a pooled connection ahead of the first real request (best effort)."""
+        try:
+            self._request("HEAD", self.api_url, timeout=5)
+        except requests.RequestException:
+            pass
+
+    def load_place_cache(self, path: str) -> None:
+        """Load conditional-GET cache entries saved by save_place_cache; a missing or unreadable file is ignored."""
+        try:
+            with open(path, "rb") as f:
+                entries: Dict[str, Dict[str, Any]] = orjson.loads(f.read())
+            for place_id, entry in entries.items():
+                response = requests.Response()
+                response.status_code = 200
+                response.url = entry["url"]
+                response.headers = CaseInsensitiveDict(entry["headers"])
+                response.encoding = "utf-8"
+                response._content = entry["content"].encode("utf-8")
+                self._remember_place(int(place_id), response)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return
+
+    def save_place_cache(self, path: str) -> None:
+        """Write the conditional-GET cache to disk so a later run can revalidate instead of re-downloading.
+        Only the PLACE_CACHE_MAX_ENTRIES most recently validated places are kept.
+
+        Raises:
+            OSError: If the cache file cannot be written
+        """
+        entries: Dict[str, Dict[str, Any]] = {
+            str(place_id): {
+                "url": response.url,
+                "headers": dict(response.headers),
+                "content": response.content.decode("utf-8", "replace"),
+            }
+            for place_id, response in list(self._place_cache.items())[-PLACE_CACHE_MAX_ENTRIES:]
+        }
+        # Written to a temp file and swapped in, so an interrupted save never leaves a truncated cache
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(entries))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
     
+    def _remove_id_from_json_file(self, full_path: str) -> str:
+        """Remove the top-level 'id' field from a single JSON file and describe the outcome."""
+        try:
+            with open(full_path, "rb") as f:
+                # Files without an "id" key anywhere can't have a top-level one, so scan the mapped
+                # file first and only read/parse on a hit (the parse stays the authoritative check)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if mm.find(b'"id"') == -1:
+                        return f"No 'id' field found in {full_path}"
+                    raw: bytes = mm[:]
+
+            data: Any = orjson.loads(raw)
+            if not (isinstance(data, dict) and 'id' in data):
+                return f"No 'id' field found in {full_path}"
+            del data['id']
+
+            # Written to a temp file and swapped in, so an interrupted run never leaves the file truncated
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(full_path)), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                os.replace(tmp_path, full_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            return f"Removed 'id' from {full_path}"
+
+        except (IOError, ValueError) as e:  # ValueError covers orjson.JSONDecodeError and empty files
+            return f"Error processing {full_path}: {e}"
+
     def remove_ids_from_json_files(self, directory: str) -> None:
         """Remove 'id' fields from all JSON files in the specified directory."""
-        for root, _, files in os.walk(directory):
-            root_path: str = root
-            filenames: List[str] = files
-            for filename in filenames:
-                if filename.endswith(".json"):
-                    full_path: str = os.path.join(root_path, filename)
-                    try:
-                        with open(full_path, "r", encoding="utf-8") as f:
-                            data: Any = json.load(f)
-                        
-                        if isinstance(data, dict) and 'id' in data:
-                            del data['id']
-                            with open(full_path, "w", encoding="utf-8") as f:
-                                json.dump(data, f, indent=2, ensure_ascii=False)
-                            print(f"Removed 'id' from {full_path}")
-                        else:
-                            print(f"No 'id' field found in {full_path}")
-
-                    except (IOError, json.JSONDecodeError) as e:
-                        print(f"Error processing {full_path}: {e}")
+        # Files are independent, so overlap their disk reads/writes across a thread pool; workers start while the walk continues
+        with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4) as executor:
+            futures = [executor.submit(self._remove_id_from_json_file, path) for path in iter_json_paths(directory)]
+            for future in as_completed(futures):
+                print(future.result())
+
+    def _remember_place(self, place_id: int, response: requests.Response) -> None:
+        """Cache a validated place response as the most recently seen, evicting the oldest beyond PLACE_CACHE_MAX_ENTRIES."""
+        with self._place_cache_lock:
+            # Re-inserted on every validation, so the cache's insertion order runs from least to most recently seen
+            self._place_cache.pop(place_id, None)
+            self._place_cache[place_id] = response
+            while len(self._place_cache) > PLACE_CACHE_MAX_ENTRIES:
+                self._place_cache.pop(next(iter(self._place_cache)))
 
     def get_place_by_id(self, place_id: int) -> requests.Response:
-        """Fetch place data from backend.
+        """Fetch place data from backend, reusing the cached response on 304 Not Modified.
 
         Raises:
             requests.RequestException: If the request fails
         """
-        url = f"{self.api_url}/api/places/{place_id}"
-        response = requests.get(url, timeout=10)
-        return response
+        url = f"{self._places_url}/{place_id}"
 
-    def get_place_id_from_bounds(self, name: str, latitude: float, longitude: float) -> Optional[int]:
-        """Fetch place data from backend by geographic bounds.
+        headers: Dict[str, str] = {}
+        cached: Optional[requests.Response] = self._place_cache.get(place_id)
+        if cached is not None:
+            if "ETag" in cached.headers:
+                headers["If-None-Match"] = cached.headers["ETag"]
+            if "Last-Modified" in cached.headers:
+                headers["If-Modified-Since"] = cached.headers["Last-Modified"]
 
-        Returns:
-            Place ID (integer) if found, None if not found
+        response = self._request("GET", url, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            self._remember_place(place_id, cached)
+            return cached
+
+        # Only responses carrying validators can be revalidated later
+        if response.status_code == 200 and ("ETag" in response.headers or "Last-Modified" in response.headers):
+            self._remember_place(place_id, response)
+        else:
+            self._place_cache.pop(place_id, None)
+        return response
+
+    def _fetch_places_in_bounds(self, latitude: float, longitude: float) -> Tuple[Dict[str, Any], ...]:
+        """Fetch the places within ~100 meters of a point from the backend.
 
         Raises:
-            requests.RequestException: If the request fails
+            requests.RequestException: If the request fails or does not return 200
             json.JSONDecodeError: If response cannot be parsed as JSON
         """
         # Params should be structured:    ?bounds=SWlat,SWlng,NElat,NElng
-        box_distance: float = 0.001  # ~100 meters around the point
-        SWlat: float = latitude - box_distance
-        SWlng: float = longitude - box_distance
-        NElat: float = latitude + box_distance
-        NElng: float = longitude + box_distance
+        SWlat: float = latitude - BOUNDS_BOX_DISTANCE
+        SWlng: float = longitude - BOUNDS_BOX_DISTANCE
+        NElat: float = latitude + BOUNDS_BOX_DISTANCE
+        NElng: float = longitude + BOUNDS_BOX_DISTANCE
         params_string: str = f"?bounds={SWlat},{SWlng},{NElat},{NElng}"
-        url: str = f"{self.api_url}/api/places/{params_string}"
+        url: str = f"{self._places_url}/{params_string}"
 
-        response: requests.Response = requests.get(url, timeout=10)
+        # Streamed so the body is only downloaded once we know it's a usable 200
+        response: requests.Response = self._request("GET", url, stream=True)
 
+        # Raised rather than returned so failed lookups are never cached
         if response.status_code != 200:
-            return None
+            response.close()
+            raise requests.HTTPError(f"Bounds lookup returned {response.status_code}", response=response)
 
         try:
-            places_list: List[Dict[str, Any]] = response.json()
-        except json.JSONDecodeError as e:
+            places_list: List[Dict[str, Any]] = orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
             raise json.JSONDecodeError(
                 f"Failed to parse JSON response from {url}",
                 e.doc,
                 e.pos
             )
 
-        for place in places_list:
-            if place.get("latitude") == latitude and place.get("longitude") == longitude:
-                return place.get("id", None)
-            elif place.get("name", "").lower() == name.lower():
-                return place.get("id", None)
+        return tuple(places_list)
+
+    def _places_in_bounds(self, latitude: float, longitude: float) -> _BoundsTile:
+        """Return the indexed places around a quantized point, from the bounds cache when possible.
+
+        Raises:
+            requests.RequestException: If the request fails or does not return 200
+            json.JSONDecodeError: If response cannot be parsed as JSON
+        """
+        key: Tuple[float, float] = (latitude, longitude)
+        with self._bounds_lock:
+            cached: Optional[_BoundsTile] = self._bounds_cache.get(key)
+            if cached is not None:
+                self._bounds_cache.move_to_end(key)
+                return cached
+            generation: int = self._bounds_generation
+
+        places: Tuple[Dict[str, Any], ...] = self._fetch_places_in_bounds(latitude, longitude)
+
+        # Index once per fetch; setdefault keeps the first place in response order, as the old linear scan did
+        ids_by_coords: Dict[Tuple[float, float], Any] = {}
+        ids_by_name: Dict[str, Any] = {}
+        for place in places:
+            coords: Optional[Tuple[float, float]] = _coords_key(place.get("latitude"), place.get("longitude"))
+            if coords is not None:
+                ids_by_coords.setdefault(coords, place.get("id"))
+            place_name: Any = place.get("name")
+            if place_name and isinstance(place_name, str):
+                ids_by_name.setdefault(place_name.lower(), place.get("id"))
+        tile = _BoundsTile(places, ids_by_coords, ids_by_name)
+
+        with self._bounds_lock:
+            if generation == self._bounds_generation:
+                self._bounds_cache[key] = tile
+                if len(self._bounds_cache) > BOUNDS_CACHE_SIZE:
+                    self._bounds_cache.popitem(last=False)
+        return tile
+
+    def _invalidate_bounds(self, places_data: Iterable[Dict[str, Any]]) -> None:
+        """Drop cached bounds tiles that a write of these places may have changed.
+
+        A tile is dropped if it lists one of the place ids or its box contains one of the new coordinates;
+        a place without usable coordinates clears the whole cache.
+        """
+        place_ids = set()
+        points: List[Tuple[float, float]] = []
+        clear_all: bool = False
+        for place_data in places_data:
+            if place_data.get("id") is not None:
+                place_ids.add(place_data["id"])
+            latitude, longitude = place_data.get("latitude"), place_data.get("longitude")
+            if isinstance(latitude, (int, float)) and isinstance(longitude, (int, float)):
+                points.append((latitude, longitude))
+            elif place_data.get("id") is None:
+                clear_all = True
+
+        with self._bounds_lock:
+            self._bounds_generation += 1
+            if clear_all:
+                self._bounds_cache.clear()
+                return
+            stale: List[Tuple[float, float]] = [
+                key for key, tile in self._bounds_cache.items()
+                if any(
+                    abs(latitude - key[0]) <= BOUNDS_BOX_DISTANCE and abs(longitude - key[1]) <= BOUNDS_BOX_DISTANCE
+                    for latitude, longitude in points
+                )
+                or any(place.get("id") in place_ids for place in tile.places)
+            ]
+            for key in stale:
+                del self._bounds_cache[key]
+
+    def get_place_id_from_bounds(self, name: str, latitude: float, longitude: float) -> Optional[int]:
+        """Fetch place data from backend by geographic bounds.
+
+        Returns:
+            Place ID (integer) if found, None if not found
+
+        Raises:
+            requests.RequestException: If the request fails
+            json.JSONDecodeError: If response cannot be parsed as JSON
+        """
+        # Quantize to ~10 m so nearby lookups share one cached bounds query; the ~100 m box still covers the point
+        try:
+            tile: _BoundsTile = self._places_in_bounds(round(latitude, 4), round(longitude, 4))
+        except requests.HTTPError:
+            return None
 
-        return None
+        # An exact location match wins over a name match
+        coords: Optional[Tuple[float, float]] = _coords_key(latitude, longitude)
+        if coords is not None and coords in tile.ids_by_coords:
+            return tile.ids_by_coords[coords]
+        return tile.ids_by_name.get(name.lower())
 
     def delete_place(self, place_id: int) -> requests.Response:
         """Delete place data from the backend API.
@@ -95,8 +415,10 @@ class BackendClient:
         Raises:
             requests.RequestException: If the request fails
         """
-        url = f"{self.api_url}/api/places/{place_id}"
-        response = requests.delete(url, timeout=10)
+        url = f"{self._places_url}/{place_id}"
+        self._place_cache.pop(place_id, None)
+        response = self._request("DELETE", url)
+        self._invalidate_bounds([{"id": place_id}])
         return response
 
     def update_place(self, place_id: int, place_data: Dict[str, Any]) -> requests.Response:
@@ -105,8 +427,10 @@ class BackendClient:
         Raises:
             requests.RequestException: If the request fails
         """
-        url = f"{self.api_url}/api/places/{place_id}"
-        response = requests.put(url, json=place_data, timeout=10)
+        url = f"{self._places_url}/{place_id}"
+        self._place_cache.pop(place_id, None)
+        response = self._send_json("PUT", url, place_data)
+        self._invalidate_bounds([{**place_data, "id": place_id}])
         return response
 
     def create_place(self, place_data: Dict[str, Any]) -> requests.Response:
@@ -115,8 +439,9 @@ class BackendClient:
         Raises:
             requests.RequestException: If the request fails
         """
-        url = f"{self.api_url}/api/places"
-        response = requests.post(url, json=place_data, timeout=10)
+        url = self._places_url
+        response = self._send_json("POST", url, place_data)
+        self._invalidate_bounds([place_data])
         return response
 
     def create_promotion(self, place_id: int, promo_data: Dict[str, Any]) -> requests.Response:
@@ -125,7 +450,60 @@ class BackendClient:
         Raises:
             requests.RequestException: If the request fails
         """
-        url = f"{self.api_url}/api/places/{place_id}/promotions"
-        response = requests.post(url, json=promo_data, timeout=10)
+        url = f"{self._places_url}/{place_id}/promotions"
+        response = self._send_json("POST", url, promo_data)
+        return response
+
+    def create_promotions_bulk(self, place_id: int, promos_data: List[Dict[str, Any]]) -> requests.Response:
+        """Create several promos for one place in the backend API in a single request.
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        url = f"{self._places_url}/{place_id}/promotions/bulk"
+        response = self._send_json("POST", url, promos_data, timeout=30)
         return response
 
+    def _request(self, method: str, url: str, timeout: float = 10, **kwargs: Any) -> requests.Response:
+        """Send a request over the pooled session with the client's default timeout, through the circuit breaker.
+
+        Raises:
+            CircuitOpenError: If the backend has been failing and the breaker is open
+            requests.RequestException: If the request fails
+        """
+        self._breaker.before_request()
+        try:
+            response: requests.Response = self.session.request(method, url, timeout=timeout, **kwargs)
+        except requests.RequestException:
+            # Any failed exchange (connection, timeout, broken or undecodable body, ...) counts against the backend
+            self._breaker.record_failure()
+            raise
+        except BaseException:
+            # Not a backend failure, but a half-open probe must still be released or the circuit never closes
+            self._breaker.release_probe()
+            raise
+        if response.status_code in BREAKER_STATUS_CODES:
+            self._breaker.record_failure()
+        else:
+            self._breaker.record_success()
+        return response
+
+    def _send_json(self, method: str, url: str, payload: Any, timeout: float = 10) -> requests.Response:
+        """Send a JSON body encoded with orjson rather than requests' stdlib json encoder."""
+        return self._request(
+            method,
+            url,
+            timeout=timeout,
+            data=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"}
+        )
+
+    def get_places_bulk(self, place_ids: List[int]) -> requests.Response:
+        """Fetch several places from the backend in a single request.
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        url = self._places_bulk_url
+        response = self._request("GET", url, timeout=30, params={"ids": ",".join(str(place_id) for place_id in place_ids)})
+        return response
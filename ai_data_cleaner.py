@@ -1,19 +1,32 @@
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import html as lxml_html
+from urllib.parse import urljoin, urlparse
+import orjson
+import tiktoken
+import io
+import re
+import hashlib
+import tempfile
 import sys
 import os
+import time
 import logging
+import asyncio
+import functools
+from datetime import datetime
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 
 from dotenv import load_dotenv
 
-from openai import OpenAI
-from openai.types.responses import ResponseUsage, ParsedResponse, ParsedResponseOutputMessage, ParsedResponseOutputText
+from openai import OpenAI, AsyncOpenAI
+from openai.types.responses import ResponseUsage, ParsedResponse
 
-from typing import Optional, cast
+from typing import List, Literal, Optional
 
-from ai_schema_config import PlaceDataExtraction, SCHEMA_DESCRIPTION
+from ai_schema_config import PlaceDataExtraction, PlaceDataExtractionBatch, SCHEMA_DESCRIPTION, BATCH_SCHEMA_DESCRIPTION
 
 # Configure logging
 logging.basicConfig(
@@ -22,128 +35,574 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Tags we extract text (and links, from anchors) from
+TEXT_TAGS = ["p", "h1", "h2", "h3", "li", "span"]
+PAGE_TAGS = TEXT_TAGS + ["a"]
+
+# How _write_to_output_file treats an existing output file
+OverwritePolicy = Literal["always", "never", "timestamp"]
+
+# Crawled responses must be HTML and are read up to this size
+HTML_CONTENT_TYPES = {"text/html", "application/xhtml+xml"}
+MAX_PAGE_BYTES = 2_000_000
+
+# lxml refuses to parse a decoded str that still carries an XML encoding declaration (common in XHTML)
+XML_DECLARATION_RE = re.compile(r"^\s*<\?xml[^>]*\?>")
+
+# Link schemes that never lead to a crawlable page
+NON_PAGE_SCHEMES = ("javascript:", "mailto:", "tel:")
+
+# Same-domain links with these (lowercased) path suffixes are assets/downloads with no text to extract
+_SKIP_SUFFIXES = (
+    ".pdf", ".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg", ".ico",
+    ".mp4", ".mov", ".mp3", ".zip", ".gz",
+    ".css", ".js", ".woff", ".woff2", ".ttf", ".eot", ".xml", ".rss"
+)
+
+# Scraped text is split into sentence-ish chunks; chunks repeated across pages are sent once
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+WHITESPACE_RE = re.compile(r"\s+")
+CHROME_PAGE_FRACTION = 0.6
+REPEATED_CHUNK_MIN_CHARS = 120
+
+# Model used for extraction; part of the response cache key
+OPENAI_MODEL = "gpt-4o-mini"
+
+# Cached extractions older than this, and the oldest beyond the entry cap, are deleted when a cleaner starts
+LLM_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+LLM_CACHE_MAX_ENTRIES = 5000
+
+# Most scraped-content tokens sent per site, shared across its pages
+PROMPT_TOKEN_BUDGET = 12000
+CHARS_PER_TOKEN_ESTIMATE = 4  # used if the tokenizer's BPE file can't be loaded
+
+# Embedding model and cosine-similarity cutoff for the optional semantic cache
+EMBEDDING_MODEL = "text-embedding-3-small"
+SEMANTIC_CACHE_THRESHOLD = 0.95
+SEMANTIC_INDEX_MAX_ENTRIES = 1000  # newest embeddings kept; bounds the index file and the per-lookup scan
+
+@functools.lru_cache(maxsize=4096)
+def _cached_urlparse(url):
+    """urlparse memoized for the repeated links seen across a crawl"""
+    return urlparse(url)
+
+@functools.lru_cache(maxsize=4096)
+def _netloc(url):
+    """Lowercased network location of a URL, memoized like _cached_urlparse"""
+    return _cached_urlparse(url).netloc.lower()
+
+@functools.lru_cache(maxsize=None)
+def _get_token_encoder():
+    """tiktoken encoder for OPENAI_MODEL, or None if it can't be loaded (its BPE file is downloaded on first use)"""
+    try:
+        return tiktoken.encoding_for_model(OPENAI_MODEL)
+    except Exception as e:
+        logger.warning(f"Could not load tokenizer for {OPENAI_MODEL}, estimating tokens from length: {e}")
+        return None
+
 class LLMCleaner:
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, semantic_cache=False, overwrite_policy:OverwritePolicy="always"):
         if api_key is None:
             load_dotenv()
             api_key = os.getenv("OPENAI_API_KEY")
         
         self.api_key = api_key
         self.client = OpenAI(api_key=api_key)
+        self.aclient = AsyncOpenAI(api_key=api_key)
         self.OUTPUT_DIR = "output_nearbySearch_ai_cleaned"
 
+        # What to do when an output file already exists: "always" replace it, "never" (raise), or
+        # "timestamp" (write alongside it under a timestamped name); never prompts, so batch runs don't block
+        self.overwrite_policy = overwrite_policy
+
         # Desired output schema from AI API
         self.schema_description = SCHEMA_DESCRIPTION
 
+        # On-disk cache of extractions keyed by prompt content, so re-runs on the same site skip the API call
+        self.cache_dir = ".llm_cache"
+        self._prune_cache()
+
+        # Opt-in: near-identical sites (shared templates, small menu edits) reuse a cached extraction.
+        # Off by default since a template shared by two different places would return the first one's details
+        self.semantic_cache = semantic_cache
+        self._semantic_index = None  # [(unit vector, cache path)], loaded lazily from disk
+        self.cache_stats = {"exact_hits": 0, "semantic_hits": 0, "misses": 0}
+
+        # Load the tokenizer up front: it's shared module-wide, and concurrent crawls would otherwise race to load it
+        _get_token_encoder()
+
+        # Shared by every crawl on this instance, so concurrent crawls (e.g. clean_many) stay bounded
+        self.page_fetch_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="page-fetch")
+
+        # Keep-alive session so subpages of the same site reuse TCP/TLS connections
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.3))
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Release the crawler's HTTP connections and worker threads"""
+        self.http.close()
+        self.page_fetch_executor.shutdown(wait=True)
+
     def _get_place_data(self, place_data_filepath: str) -> dict:
         """Load place data from a JSON file."""
         if not os.path.exists(place_data_filepath):
             logger.warning(f"Place data file not found: {place_data_filepath}")
             raise FileNotFoundError(f"Place data file not found: {place_data_filepath}")
 
-        with open(place_data_filepath, "r") as f:
-            return json.load(f)
+        with open(place_data_filepath, "rb") as f:
+            return orjson.loads(f.read())
 
-    def _is_same_domain(self, link_url, root_url):
-        """Check if link is from the same domain as root URL"""
-        from urllib.parse import urlparse
-        
-        link_domain = urlparse(link_url.lower()).netloc
-        root_domain = urlparse(root_url.lower()).netloc
-        
-        return link_domain == root_domain
+    def _is_asset_url(self, link_url):
+        """Check if link points at a non-page asset (image, script, download) by its path suffix"""
+        return _cached_urlparse(link_url).path.lower().endswith(_SKIP_SUFFIXES)
 
-    def _fetch_page_content(self, url):
-        """Fetch text content and relevant links from a single page"""
-        try:
-            response = requests.get(url, timeout=10)
+    def _read_html_body(self, url):
+        """Download a page's HTML, reading at most MAX_PAGE_BYTES; returns "" for non-HTML responses"""
+        with self.http.get(url, timeout=10, stream=True) as response:
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
 
-            # Extract visible text from important elements
-            text_elements = soup.find_all(["p", "h1", "h2", "h3", "li", "span"])
-            text = " ".join([element.get_text(separator=" ", strip=True) for element in text_elements])
+            content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+            if content_type not in HTML_CONTENT_TYPES:
+                logger.info(f"Skipping non-HTML page {url} ({content_type or 'no content type'})")
+                return ""
+
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=65536):
+                body.extend(chunk)
+                if len(body) > MAX_PAGE_BYTES:
+                    logger.info(f"Truncating page {url} at {MAX_PAGE_BYTES} bytes")
+                    del body[MAX_PAGE_BYTES:]
+                    break
+
+            return body.decode(response.encoding or "utf-8", errors="replace")
+
+    def _fetch_page_content(self, url, root_netloc=None):
+        """Fetch text content and relevant links from a single page"""
+        if root_netloc is None:
+            root_netloc = _netloc(url)
+
+        try:
+            page_html = self._read_html_body(url)
+            if not page_html:
+                return "", set()
+            # Pages are full documents, so skip fromstring()'s document-vs-fragment sniffing. The body is
+            # already decoded, so its encoding declaration is dropped rather than rejected by lxml.
+            root = lxml_html.document_fromstring(XML_DECLARATION_RE.sub("", page_html, count=1))
+
+            # Single pass: visible text from important elements, relevant subpage (same domain) links from anchors
+            text_parts = []
+            subpage_links = set()  # Deduplicated as they're found
+            for element in root.iter(*PAGE_TAGS):
+                if element.tag != "a":
+                    text_parts.append(" ".join(part.strip() for part in element.itertext() if part.strip()))
+                    continue
 
-            # Find relevant subpage (same domain) links
-            subpage_links = []
-            for link in soup.find_all("a", href=True):
-                href = link["href"].lower()
-                if (href.startswith('#') or href.startswith('javascript:')): 
+                href = element.get("href")
+                if not href:
+                    continue
+                # Only the scheme prefix is case-insensitive; keep the path's case for the request
+                if href[0] == '#' or href[:11].lower().startswith(NON_PAGE_SCHEMES):
                     continue
 
                 full_url = urljoin(url, href)
-                if self._is_same_domain(full_url, url): 
-                    subpage_links.append(full_url)
+                if _netloc(full_url) == root_netloc and not self._is_asset_url(full_url):
+                    subpage_links.add(full_url)
+
+            # One element per line, so repeated blocks (nav, footer) can be recognized across pages
+            text = "\n".join(part for part in text_parts if part)
 
-            return text, list(set(subpage_links))
+            return text, subpage_links
 
         except Exception as e:
             logger.error(f"Error fetching page content from {url}: {e}")
-            return "", []
+            return "", set()
 
     def _collect_site_content(self, root_url, max_pages=10):
         """Collect text content from root URL and relevant subpages"""
 
-        visited = set()
-        to_visit = [root_url]
-        all_content = []
+        to_visit = deque([root_url])
+        seen = {root_url}  # Every link ever queued; fetched pages are a subset, so one set dedupes both
+        pages_fetched = 0
+        pages = []  # (url, text) in crawl order
+
+        # Every crawled page shares the root's domain, so resolve it once per crawl
+        fetch_page = functools.partial(self._fetch_page_content, root_netloc=_netloc(root_url))
+
+        while to_visit and pages_fetched < max_pages:
+
+            # Take as many queued links as the page budget allows
+            batch = []
+            while to_visit and pages_fetched + len(batch) < max_pages:
+                current_url = to_visit.popleft()
 
-        while to_visit and len(visited) < max_pages:
-            current_url = to_visit.pop(0)
+                #  Filter anchor links (e.g. 'https://www.example.com/#section')
+                if '#' in current_url: continue
+                batch.append(current_url)
+            pages_fetched += len(batch)
 
-            #  Filter seen links and anchor links (e.g. 'https://www.example.com/#section')
-            if (current_url in visited) or ('#' in current_url): continue        
-            
-            # Fetch and process new unseen link    
-            visited.add(current_url)
-            text, new_links = self._fetch_page_content(current_url)
-            all_content.append(f"=== {current_url} ===\n{text}")
+            # Fetch the batch concurrently, map() keeps results in queue order
+            for current_url, (text, new_links) in zip(batch, self.page_fetch_executor.map(fetch_page, batch)):
+                pages.append((current_url, text))
 
-            # Add new unvisited, non-anchor links to queue
-            for link in new_links:
-                if (link not in visited) and (link not in to_visit) and (not '#' in link):
+                # Add new unseen, non-anchor links to queue (cheap substring test first, then the set lookup)
+                for link in new_links:
+                    if '#' in link or link in seen:
+                        continue
+                    seen.add(link)
                     to_visit.append(link)
 
-        
+        deduped_pages = [(current_url, " ".join(chunks)) for current_url, chunks in self._dedupe_site_chunks(pages)]
+
+        all_content = io.StringIO()  # Pages are written once and materialized once at the end
+        for current_url, text in self._apply_token_budget(deduped_pages):
+            if all_content.tell(): all_content.write("\n")
+            all_content.write(f"=== {current_url} ===\n")
+            all_content.write(text)
+
+        return all_content.getvalue()
+
+    def _apply_token_budget(self, pages, budget=PROMPT_TOKEN_BUDGET):
+        """Truncate pages so their text fits within `budget` tokens in total
+
+        The budget is split fairly: pages shorter than an even share keep all their text
+        and the leftover goes to the longer pages, so every subpage stays represented."""
+        encoder = _get_token_encoder()
+        if encoder is not None:
+            page_tokens = [encoder.encode(text) for _, text in pages]
+            lengths = [len(tokens) for tokens in page_tokens]
+        else:
+            lengths = [-(-len(text) // CHARS_PER_TOKEN_ESTIMATE) for _, text in pages]
+        if sum(lengths) <= budget:
+            return pages
+
+        # Hand out the budget from the shortest page up, each taking at most an even share of what's left
+        allowances = [0] * len(pages)
+        remaining = budget
+        for handed_out, i in enumerate(sorted(range(len(pages)), key=lengths.__getitem__)):
+            allowances[i] = min(lengths[i], remaining // (len(pages) - handed_out))
+            remaining -= allowances[i]
+
+        budgeted = []
+        for i, (url, text) in enumerate(pages):
+            if allowances[i] < lengths[i]:
+                if encoder is not None:
+                    text = encoder.decode(page_tokens[i][:allowances[i]])
+                else:
+                    text = text[:allowances[i] * CHARS_PER_TOKEN_ESTIMATE]
+            budgeted.append((url, text))
+        return budgeted
+
+    def _dedupe_site_chunks(self, pages):
+        """Split each page into whitespace-collapsed sentence chunks and drop repeats of site chrome
+
+        A chunk on at least CHROME_PAGE_FRACTION of the pages (nav, footer) or longer than
+        REPEATED_CHUNK_MIN_CHARS (shared paragraphs) is kept only where it first appears, so
+        details that live in the footer (address, phone, hours) are still sent once."""
+        page_chunks = []
+        for url, text in pages:
+            chunks = []
+            for line in text.split("\n"):
+                for sentence in SENTENCE_SPLIT_RE.split(line):
+                    chunk = WHITESPACE_RE.sub(" ", sentence).strip()
+                    if chunk:
+                        chunks.append(chunk)
+            page_chunks.append((url, chunks))
+
+        # Number of pages each chunk appears on
+        page_counts = Counter(chunk for _, chunks in page_chunks for chunk in set(chunks))
+        chrome_min_pages = max(2, CHROME_PAGE_FRACTION * len(pages))
+
+        emitted = set()
+        deduped = []
+        for url, chunks in page_chunks:
+            kept = []
+            for chunk in chunks:
+                repeated = page_counts[chunk] >= chrome_min_pages or (page_counts[chunk] > 1 and len(chunk) > REPEATED_CHUNK_MIN_CHARS)
+                if repeated:
+                    if chunk in emitted:
+                        continue
+                    emitted.add(chunk)
+                kept.append(chunk)
+            deduped.append((url, kept))
+        return deduped
+
+    def _extract_parsed_response(self, response: ParsedResponse[PlaceDataExtraction]) -> PlaceDataExtraction:
+        """Log token usage and pull the structured output from an OpenAI response"""
+
+        # Log token usage info
+        usage_info: ResponseUsage = response.usage
+        input_tokens = usage_info.input_tokens
+        output_tokens = usage_info.output_tokens
+        total_tokens = usage_info.total_tokens
+        logger.info(f"Token usage - Input: {input_tokens}, Output: {output_tokens}, Total: {total_tokens}")
+
+        # Structured output is already schema-validated by the SDK; it is only missing on a refusal
+        response_parsed: Optional[PlaceDataExtraction] = response.output_parsed
+        if response_parsed is None:
+            raise ValueError("OpenAI response contained no structured output (possibly a refusal)")
 
-        return "\n".join(all_content)
+        return response_parsed
 
-    def call_openai_api(self, scraped_website_content: str) -> dict[str]:
+    def _cache_path(self, scraped_website_content: str) -> str:
+        """Path of the cached extraction for this model/schema/content combination"""
+        key = hashlib.sha256(
+            "\x00".join([OPENAI_MODEL, self.schema_description, scraped_website_content]).encode()
+        ).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _load_cached_extraction(self, scraped_website_content: str) -> Optional[PlaceDataExtraction]:
+        """Return the cached extraction for this content, or None on a miss"""
+        cache_path = self._cache_path(scraped_website_content)
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, "rb") as f:
+                cached = PlaceDataExtraction.model_validate_json(f.read())
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {cache_path}: {e}")
+            return None
+        logger.info("Token usage - Input: 0, Output: 0, Total: 0 (served from cache)")
+        return cached
+
+    def _store_cached_extraction(self, scraped_website_content: str, extraction: PlaceDataExtraction):
+        """Write an extraction to the cache atomically, so concurrent runs never see a partial file"""
+        cache_path = self._cache_path(scraped_website_content)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry {cache_path}: {e}")
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(extraction.model_dump_json())
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry {cache_path}: {e}")
+            os.unlink(tmp_path)
+
+    def _prune_cache(self):
+        """Delete cached extractions (and temp files left by interrupted writes) older than LLM_CACHE_TTL_SECONDS,
+        then the oldest extractions beyond LLM_CACHE_MAX_ENTRIES"""
+        try:
+            with os.scandir(self.cache_dir) as it:
+                entries = [(entry.stat().st_mtime, entry.path) for entry in it
+                           if entry.is_file() and entry.path != self._semantic_index_path()]
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning(f"Failed to prune cache {self.cache_dir}: {e}")
+            return
+
+        expired_before = time.time() - LLM_CACHE_TTL_SECONDS
+        entries.sort(reverse=True)  # Newest first
+        kept = 0
+        for mtime, path in entries:
+            if mtime >= expired_before:
+                # Fresh temp files may belong to a write still in progress in another run
+                if not path.endswith(".json"):
+                    continue
+                if kept < LLM_CACHE_MAX_ENTRIES:
+                    kept += 1
+                    continue
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning(f"Failed to remove cache entry {path}: {e}")
+
+    def _semantic_index_path(self) -> str:
+        return os.path.join(self.cache_dir, "embeddings.json")
+
+    def _load_semantic_index(self) -> list:
+        """Load the (vector, cache path) pairs recorded by earlier runs"""
+        if self._semantic_index is None:
+            self._semantic_index = []
+            try:
+                with open(self._semantic_index_path(), "rb") as f:
+                    entries = orjson.loads(f.read())[-SEMANTIC_INDEX_MAX_ENTRIES:]
+                # Extractions pruned from the cache since the index was written can't be served
+                self._semantic_index = [(entry["vector"], entry["path"]) for entry in entries if os.path.exists(entry["path"])]
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable semantic cache index: {e}")
+        return self._semantic_index
+
+    def _normalize_embedding(self, embedding) -> list:
+        """Scale an embedding to unit length so a dot product is the cosine similarity"""
+        norm = sum(x * x for x in embedding) ** 0.5
+        return [x / norm for x in embedding] if norm else list(embedding)
+
+    def _semantic_lookup(self, vector: list) -> Optional[PlaceDataExtraction]:
+        """Return the cached extraction of the most similar previously seen content, if similar enough"""
+        best_similarity, best_path = 0.0, None
+        for cached_vector, cached_path in self._load_semantic_index():
+            similarity = sum(a * b for a, b in zip(vector, cached_vector))
+            if similarity > best_similarity:
+                best_similarity, best_path = similarity, cached_path
+        if best_path is None or best_similarity < SEMANTIC_CACHE_THRESHOLD:
+            return None
+
+        try:
+            with open(best_path, "rb") as f:
+                cached = PlaceDataExtraction.model_validate_json(f.read())
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {best_path}: {e}")
+            return None
+        logger.info(f"Token usage - Input: 0, Output: 0, Total: 0 (semantic cache hit, similarity {best_similarity:.3f})")
+        return cached
+
+    def _semantic_store(self, vector: list, cache_path: str):
+        """Record the embedding of newly extracted content and rewrite the index atomically"""
+        index = self._load_semantic_index()
+        index.append((vector, cache_path))
+        # Oldest entries are dropped first
+        del index[:-SEMANTIC_INDEX_MAX_ENTRIES]
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        except OSError as e:
+            logger.warning(f"Failed to write semantic cache index: {e}")
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps([{"vector": v, "path": p} for v, p in index]))
+            os.replace(tmp_path, self._semantic_index_path())
+        except OSError as e:
+            logger.warning(f"Failed to write semantic cache index: {e}")
+            os.unlink(tmp_path)
+
+    def _lookup_cache(self, scraped_website_content: str, embedding) -> Optional[PlaceDataExtraction]:
+        """Check the exact cache, then (given an embedding) the semantic cache, counting hits and misses"""
+        cached = self._load_cached_extraction(scraped_website_content)
+        if cached is not None:
+            self.cache_stats["exact_hits"] += 1
+            return cached
+        if embedding is not None:
+            cached = self._semantic_lookup(embedding)
+            if cached is not None:
+                self.cache_stats["semantic_hits"] += 1
+                return cached
+        self.cache_stats["misses"] += 1
+        return None
+
+    def _store_cache(self, scraped_website_content: str, extraction: PlaceDataExtraction, embedding):
+        self._store_cached_extraction(scraped_website_content, extraction)
+        if embedding is not None:
+            self._semantic_store(embedding, self._cache_path(scraped_website_content))
+
+    def _embed(self, scraped_website_content: str) -> Optional[list]:
+        """Unit-length embedding of the scraped content for the semantic cache, or None if disabled/unavailable"""
+        if not self.semantic_cache or os.path.exists(self._cache_path(scraped_website_content)):
+            return None
+        try:
+            response = self.client.embeddings.create(model=EMBEDDING_MODEL, input=scraped_website_content[:8000])
+        except Exception as e:
+            logger.warning(f"Embedding request failed, skipping semantic cache: {e}")
+            return None
+        return self._normalize_embedding(response.data[0].embedding)
+
+    async def _embed_async(self, scraped_website_content: str) -> Optional[list]:
+        """Async variant of _embed"""
+        if not self.semantic_cache or os.path.exists(self._cache_path(scraped_website_content)):
+            return None
+        try:
+            response = await self.aclient.embeddings.create(model=EMBEDDING_MODEL, input=scraped_website_content[:8000])
+        except Exception as e:
+            logger.warning(f"Embedding request failed, skipping semantic cache: {e}")
+            return None
+        return self._normalize_embedding(response.data[0].embedding)
+
+    def call_openai_api(self, scraped_website_content: str) -> PlaceDataExtraction:
         """Use OpenAI API to refine unstructured text data into structured format"""
 
+        embedding = self._embed(scraped_website_content)
+        cached = self._lookup_cache(scraped_website_content, embedding)
+        if cached is not None:
+            return cached
+
         # Call OpenAI API with unstructured text input and predefined schema instructions
         logger.info("Refining text data with OpenAI API...")
         try:
             response: ParsedResponse[PlaceDataExtraction] = self.client.responses.parse(
-                model="gpt-4o-mini",
-                input=[
-                    {"role": "system", "content": self.schema_description},
-                    {"role": "user", "content": scraped_website_content}
-                ],
+                model=OPENAI_MODEL,
+                instructions=self.schema_description,  # Identical across calls, so it stays a cacheable prompt prefix
+                input=scraped_website_content,
                 text_format=PlaceDataExtraction
             )
         except Exception as e:
             logger.error(f"Error calling OpenAI API: {e}")
             raise
 
-        # Log token usage info
-        usage_info: ResponseUsage = response.usage
-        input_tokens = usage_info.input_tokens
-        output_tokens = usage_info.output_tokens
-        total_tokens = usage_info.total_tokens
-        logger.info(f"Token usage - Input: {input_tokens}, Output: {output_tokens}, Total: {total_tokens}")
+        extraction = self._extract_parsed_response(response)
+        self._store_cache(scraped_website_content, extraction, embedding)
+        return extraction
 
-        # Extract structured data output from response
-        response_message: ParsedResponseOutputMessage[PlaceDataExtraction] = response.output[0]
-        response_content: ParsedResponseOutputText[PlaceDataExtraction] = cast(
-            ParsedResponseOutputText[PlaceDataExtraction], response_message.content[0]
-        )
-        response_parsed: PlaceDataExtraction = response_content.parsed
+    async def call_openai_api_async(self, scraped_website_content: str) -> PlaceDataExtraction:
+        """Async variant of call_openai_api, so many extractions can be in flight at once"""
 
-        return response_parsed
+        embedding = await self._embed_async(scraped_website_content)
+        cached = self._lookup_cache(scraped_website_content, embedding)
+        if cached is not None:
+            return cached
+
+        logger.info("Refining text data with OpenAI API...")
+        try:
+            response: ParsedResponse[PlaceDataExtraction] = await self.aclient.responses.parse(
+                model=OPENAI_MODEL,
+                instructions=self.schema_description,
+                input=scraped_website_content,
+                text_format=PlaceDataExtraction
+            )
+        except Exception as e:
+            logger.error(f"Error calling OpenAI API: {e}")
+            raise
+
+        extraction = self._extract_parsed_response(response)
+        self._store_cache(scraped_website_content, extraction, embedding)
+        return extraction
 
-    def _write_to_output_file(self, content:str, subdirectory:Optional[str], filename:str):
-        """Write content to output file, with option to overwrite if file exists"""
+    def call_openai_api_batch(self, scraped_website_contents: List[str]) -> List[Optional[PlaceDataExtraction]]:
+        """Extract several places' website content in one OpenAI call, returned in input order
+        (None for any place the model did not return)"""
+
+        user_content = "\n".join(f"=== PLACE {i} ===\n{content}" for i, content in enumerate(scraped_website_contents))
+
+        logger.info(f"Refining text data for {len(scraped_website_contents)} places with one OpenAI API call...")
+        try:
+            response: ParsedResponse[PlaceDataExtractionBatch] = self.client.responses.parse(
+                model=OPENAI_MODEL,
+                instructions=BATCH_SCHEMA_DESCRIPTION,
+                input=user_content,
+                text_format=PlaceDataExtractionBatch
+            )
+        except Exception as e:
+            logger.error(f"Error calling OpenAI API: {e}")
+            raise
+
+        usage_info: ResponseUsage = response.usage
+        logger.info(f"Token usage - Input: {usage_info.input_tokens}, Output: {usage_info.output_tokens}, Total: {usage_info.total_tokens}")
+        batch: Optional[PlaceDataExtractionBatch] = response.output_parsed
+        if batch is None:
+            raise ValueError("OpenAI response contained no structured output (possibly a refusal)")
+
+        # Fan the array back out by index tag, ignoring any index the model invented
+        extractions: List[Optional[PlaceDataExtraction]] = [None] * len(scraped_website_contents)
+        for entry in batch.places:
+            if 0 <= entry.index < len(extractions):
+                extractions[entry.index] = entry.place
+        return extractions
+
+    def _write_to_output_file(self, data:dict, subdirectory:Optional[str], filename:str):
+        """Write data as JSON to output file, handling an existing file per self.overwrite_policy"""
 
         # Ensure output directory/subdirectory exists and create full path
         os.makedirs(self.OUTPUT_DIR, exist_ok=True)
@@ -153,22 +612,24 @@ class LLMCleaner:
         else:
             full_path = os.path.join(self.OUTPUT_DIR, filename)
 
-        # Parse content to ensure valid JSON before writing
+        # Serialize once, straight to pretty-printed bytes
         try:
-            data = json.loads(content)
-        except json.JSONDecodeError:
-            raise ValueError("Failed to parse content as JSON.")
-
-        # Write to output file, prompt if overwriting existing content
-        if os.path.exists(full_path) and (input(f"File {filename} exists. Replace existing content? (y/n): ") == 'y'):
-            with open(full_path, "w", encoding="utf-8") as f:
-                f.write(json.dumps(data, ensure_ascii=False, indent=2)+"\n")
-        else:
-            with open(full_path, "w", encoding="utf-8") as f:
-                f.write(json.dumps(data, ensure_ascii=False, indent=2)+"\n")
-
-    def process_url(self, place_data:dict, output_filename:str, verbose:bool=False):
-        """Process a single URL and write results to output file"""
+            output = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            raise ValueError("Failed to serialize data as JSON.")
+
+        if os.path.exists(full_path):
+            if self.overwrite_policy == "never":
+                raise FileExistsError(f"File {full_path} exists and overwrite policy is 'never'")
+            if self.overwrite_policy == "timestamp":
+                root, ext = os.path.splitext(full_path)
+                full_path = f"{root}.{datetime.now().strftime('%Y%m%dT%H%M%S')}{ext}"
+
+        with open(full_path, "wb") as f:
+            f.write(output)
+
+    def _scrape_website(self, place_data:dict, verbose:bool=False) -> str:
+        """Crawl the place's website and return the collected text content"""
         website_url = place_data.get("website")
         if not website_url:
             raise ValueError("No valid website URL found in place data.")
@@ -179,23 +640,44 @@ class LLMCleaner:
         if (len(scraped_website_content) == 0): 
             raise ValueError("No content collected from base url")
 
-        # Refine the collected content using LLM (currently gpt-4o-mini) and turn into python dict
-        openai_output: PlaceDataExtraction = self.call_openai_api(scraped_website_content=scraped_website_content)
+        return scraped_website_content
+
+    def _save_structured_data(self, place_data:dict, openai_output:PlaceDataExtraction, output_filename:str, verbose:bool=False):
+        """Merge LLM output with the original place data and write it to the output file"""
         structured_place_data_dict = openai_output.model_dump()
 
-        # Include id and coordinates into structured_data from place_data and save as json object
+        # Include id and coordinates into structured_data from place_data
         structured_place_data_dict["id"] = place_data.get("id")
         structured_place_data_dict["latitude"] = place_data.get("latitude")
         structured_place_data_dict["longitude"] = place_data.get("longitude")
-        structured_place_data_json = json.dumps(structured_place_data_dict, ensure_ascii=False, indent=2)
 
         # Compare to existing place data
         for key in place_data:
             if key in structured_place_data_dict and place_data[key] != structured_place_data_dict[key]:
                 logger.info(f"Field '{key}' differs from original data. Original: {place_data[key]}, New: {structured_place_data_dict[key]}")
 
-        self._write_to_output_file(structured_place_data_json, place_data.get("state_code", "unknown_state"), output_filename)
-        if verbose: logger.info(f"Finished processing {website_url}, saved as {output_filename}")
+        self._write_to_output_file(structured_place_data_dict, place_data.get("state_code", "unknown_state"), output_filename)
+        if verbose: logger.info(f"Finished processing {place_data.get('website')}, saved as {output_filename}")
+
+    def process_url(self, place_data:dict, output_filename:str, verbose:bool=False):
+        """Process a single URL and write results to output file"""
+        scraped_website_content = self._scrape_website(place_data, verbose=verbose)
+
+        # Refine the collected content using LLM (currently gpt-4o-mini) and turn into python dict
+        openai_output: PlaceDataExtraction = self.call_openai_api(scraped_website_content=scraped_website_content)
+        self._save_structured_data(place_data, openai_output, output_filename, verbose=verbose)
+
+    async def process_url_async(self, place_data:dict, output_filename:str, verbose:bool=False,
+                                llm_semaphore:Optional[asyncio.Semaphore]=None):
+        """Async variant of process_url, blocking crawl/file work runs in worker threads
+        (only the OpenAI call is held to `llm_semaphore`, page fetches are bounded by the crawl executor)"""
+        scraped_website_content = await asyncio.to_thread(self._scrape_website, place_data, verbose)
+        if llm_semaphore is None:
+            openai_output: PlaceDataExtraction = await self.call_openai_api_async(scraped_website_content=scraped_website_content)
+        else:
+            async with llm_semaphore:
+                openai_output = await self.call_openai_api_async(scraped_website_content=scraped_website_content)
+        await asyncio.to_thread(self._save_structured_data, place_data, openai_output, output_filename, verbose)
 
     def _get_ai_cleaned_filename(self, place_data_filepath:str) -> str:
         """Get the filename for the AI cleaned place data."""
@@ -220,17 +702,78 @@ class LLMCleaner:
         except Exception as e:
             logger.error(f"Error occurred while processing place data: {e}")
 
+    async def clean_many(self, place_data_filepaths: List[str], concurrency:int = 10, verbose:bool = True):
+        """Clean several place data files concurrently, with at most `concurrency` OpenAI calls in flight"""
+        llm_semaphore = asyncio.Semaphore(concurrency)
+
+        async def clean_one(place_data_filepath: str):
+            try:
+                place_data: dict = self._get_place_data(place_data_filepath)
+                new_filename = self._get_ai_cleaned_filename(place_data_filepath)
+                if verbose: logger.info(f"Processing place website: {place_data.get('website')} into {new_filename}")
+                await self.process_url_async(place_data=place_data, output_filename=new_filename, verbose=verbose,
+                                             llm_semaphore=llm_semaphore)
+            except Exception as e:
+                logger.error(f"Error occurred while processing place data from {place_data_filepath}: {e}")
+
+        await asyncio.gather(*(clean_one(path) for path in place_data_filepaths))
+
+    def clean_places(self, place_data_filepaths: List[str], concurrency:int = 10, verbose:bool = True):
+        """Synchronous entry point for clean_many"""
+        asyncio.run(self.clean_many(place_data_filepaths, concurrency=concurrency, verbose=verbose))
+
+    def clean_places_batch(self, place_data_filepaths: List[str], batch_size:int = 5, verbose:bool = True):
+        """Clean several place data files, sending up to `batch_size` scraped sites per OpenAI call"""
+        pending = []  # (place_data, output filename, scraped content) still needing an extraction
+
+        for place_data_filepath in place_data_filepaths:
+            try:
+                place_data: dict = self._get_place_data(place_data_filepath)
+                new_filename = self._get_ai_cleaned_filename(place_data_filepath)
+                if verbose: logger.info(f"Processing place website: {place_data.get('website')} into {new_filename}")
+                scraped_website_content = self._scrape_website(place_data, verbose=verbose)
+
+                cached = self._lookup_cache(scraped_website_content, None)
+                if cached is not None:
+                    self._save_structured_data(place_data, cached, new_filename, verbose=verbose)
+                else:
+                    pending.append((place_data, new_filename, scraped_website_content))
+            except Exception as e:
+                logger.error(f"Error occurred while processing place data from {place_data_filepath}: {e}")
+
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            try:
+                extractions = self.call_openai_api_batch([content for _, _, content in batch])
+            except Exception as e:
+                logger.error(f"Error occurred while processing batch of {len(batch)} places: {e}")
+                continue
+
+            for (place_data, new_filename, scraped_website_content), extraction in zip(batch, extractions):
+                if extraction is None:
+                    logger.error(f"No extraction returned for {place_data.get('website')}")
+                    continue
+                try:
+                    self._store_cache(scraped_website_content, extraction, None)
+                    self._save_structured_data(place_data, extraction, new_filename, verbose=verbose)
+                except Exception as e:
+                    logger.error(f"Error occurred while saving place data for {place_data.get('website')}: {e}")
+
 if __name__ == "__main__":
 
-    if len(sys.argv) != 2:
-        print("Usage: python ai_data_cleaner.py <filepath_to_placedata>")
+    if len(sys.argv) < 2:
+        print("Usage: python ai_data_cleaner.py <filepath_to_placedata> [<filepath_to_placedata> ...]")
         sys.exit(1)
 
-    filepath = sys.argv[1]
+    filepaths = sys.argv[1:]
 
     try:
-        cleaner = LLMCleaner()
-        cleaner.clean_place_data(filepath, verbose=True)
+        with LLMCleaner() as cleaner:
+            if len(filepaths) == 1:
+                cleaner.clean_place_data(filepaths[0], verbose=True)
+            else:
+                # Independent places: crawl and extract them concurrently
+                cleaner.clean_places(filepaths, verbose=True)
     except Exception as e:
         logger.error(f"Error occurred while cleaning place data: {e}")
 
@@ -1,5 +1,5 @@
 from typing import Optional, List
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 class DailyHours(BaseModel):
     day: str  # e.g. "Monday"
@@ -8,16 +8,14 @@ class DailyHours(BaseModel):
     close_hour: int  # 0–23
     close_minute: Optional[int] = None  # 0–59
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 class PromotionData(BaseModel):
     title: str
     description: Optional[str] = None
     hours: Optional[List[DailyHours]] = None
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 class EventData(BaseModel):
     title: str
@@ -26,8 +24,7 @@ class EventData(BaseModel):
     end_date: str
     hours: Optional[List[DailyHours]] = None
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 class MenuItem(BaseModel):
     name: str
@@ -35,8 +32,7 @@ class MenuItem(BaseModel):
     price: float
     category: str
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 class PlaceDataExtraction(BaseModel):
     name: str
@@ -64,8 +60,18 @@ class PlaceDataExtraction(BaseModel):
     menu_data: Optional[List[MenuItem]] = None
     event_data: Optional[List[EventData]] = None
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+class IndexedPlaceDataExtraction(BaseModel):
+    index: int  # matches the "=== PLACE i ===" tag in the batched input
+    place: PlaceDataExtraction
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+class PlaceDataExtractionBatch(BaseModel):
+    places: List[IndexedPlaceDataExtraction]
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 SCHEMA_DESCRIPTION = """You are an expert at structured data extraction. You will be given unstructured
 text from a business's website and should convert it into the provided schema.
@@ -123,4 +129,11 @@ menu_data = [
 - If an item spans an entire day and no specific times are given, use open_hour = 0 and close_hour = 0.
 - Do not invent fields not defined in the schema. Only use the properties described above.
 - If certain information is not available, omit that field. If hours information is not specified, assume it spans the entire day.
-- Ensure the final output is valid JSON and adheres to the schema."""
\ No newline at end of file
+- Ensure the final output is valid JSON and adheres to the schema."""
+
+BATCH_SCHEMA_DESCRIPTION = SCHEMA_DESCRIPTION + """
+
+#### Multiple places
+The input contains text from several businesses' websites, each introduced by a line "=== PLACE i ===".
+Return one entry in `places` per business, with `index` set to i and `place` extracted only from
+the text following that business's tag."""
@@ -1,55 +1,190 @@
 import requests
 import os
-import json
+import orjson
 import sys
-from typing import Any, Dict, List, cast
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, cast
 from clean_nearby_places import process_places
-from BackendClient import BackendClient
+from BackendClient import BackendClient, CircuitOpenError, iter_json_paths
 
 # IMPROVEMENTS:
 # - Include datetime in object to determine time since last request
 # - Add retry logic with exponential backoff for failed requests
 # - Add logging to file with timestamps
 
-backendClient: BackendClient = BackendClient()
+# Pooled backend connections; raise alongside the worker counts below (CLI_POOL_SIZE overrides)
+backendClient: BackendClient = BackendClient(pool_maxsize=int(os.getenv("CLI_POOL_SIZE", "64")))
+
+# Concurrent place requests in non-interactive processing of existing places
+NONINTERACTIVE_WORKERS: int = 32
+
+# IDs per bulk lookup when scanning existing places
+ID_SCAN_CHUNK_SIZE: int = 100
+
+# Concurrent promotion creations when posting a single AI cleaned file
+PROMO_WORKERS: int = 8
+
+# Bulk promotion statuses meaning "no such endpoint" (404 only when the place is known to exist)
+BULK_UNSUPPORTED_STATUS_CODES: frozenset = frozenset({405, 501})
+
+# Concurrent files when posting a whole output directory ('all')
+POST_FILE_WORKERS: int = 8
+
+# Printed response bodies are cut to this many bytes unless CLI_VERBOSE is set
+RESPONSE_PREVIEW_BYTES: int = 200
+CLI_VERBOSE: bool = bool(os.getenv("CLI_VERBOSE"))
+
+# Place GET responses persisted between runs (disable with --no-cache)
+PLACE_CACHE_PATH: str = ".place_cache.json"
+
+# Horizontal rules for console output, built once
+DASH_RULE: str = "-" * 60
+TILDE_RULE: str = "~" * 60
+
+# ANSI escape: clear the screen and move the cursor home
+CLEAR_SCREEN: str = "\x1b[2J\x1b[H"
+# Checked once: when output is piped or redirected the escape would only end up as noise in the file
+CLEAR_SCREEN_ENABLED: bool = sys.stdout.isatty()
+
+# Serializes console output from concurrent workers
+_print_lock = threading.Lock()
+
+
+def _delete_place_noninteractive(place_id: int) -> str:
+    """Delete a place and describe the outcome."""
+    response = backendClient.delete_place(place_id)
+    return f"Deleted place ID {place_id} ({response.status_code})"
+
+def _update_place_noninteractive(place_id: int) -> str:
+    """Update a place with empty data and describe the outcome."""
+    response = backendClient.update_place(place_id, place_data={})
+    return f"Updated place ID {place_id} ({response.status_code})"
+
+def _skip_place_noninteractive(place_id: int) -> str:
+    """Leave a place untouched and describe the outcome."""
+    return f"Skipped place ID {place_id}"
+
+# Non-interactive actions ('d' delete, 'u' update, 's' skip) and their handlers
+_NONINTERACTIVE_ACTIONS = frozenset(('d', 'u', 's'))
+_NONINTERACTIVE_DISPATCH: Dict[str, Callable[[int], str]] = {
+    'd': _delete_place_noninteractive,
+    'u': _update_place_noninteractive,
+    's': _skip_place_noninteractive,
+}
+# Dry-run stand-ins: describe what each action would do without sending anything
+_NONINTERACTIVE_DRY_RUN_DISPATCH: Dict[str, Callable[[int], str]] = {
+    'd': lambda place_id: f"Would delete place ID {place_id}",
+    'u': lambda place_id: f"Would update place ID {place_id}",
+    's': _skip_place_noninteractive,
+}
+
+def _response_json(response: requests.Response) -> Any:
+    """Decode a backend response body with orjson (raises ValueError if it isn't JSON)."""
+    return orjson.loads(response.content)
+
+def _is_success(response: requests.Response) -> bool:
+    """Whether a backend response is 2xx (requests' response.ok also accepts 3xx)."""
+    return 200 <= response.status_code < 300
+
+def _response_preview(response: requests.Response) -> str:
+    """Response body for console output: the first RESPONSE_PREVIEW_BYTES only, unless CLI_VERBOSE is set."""
+    if CLI_VERBOSE:
+        return response.text
+    preview = response.content[:RESPONSE_PREVIEW_BYTES].decode("utf-8", "replace")
+    return preview + "..." if len(response.content) > RESPONSE_PREVIEW_BYTES else preview
+
+def _existing_place_ids(place_ids: List[int]) -> Optional[Set[int]]:
+    """IDs among place_ids that the bulk endpoint returns, or None if bulk lookup is unavailable or its response is unexpected."""
+    try:
+        response = backendClient.get_places_bulk(place_ids)
+        if response.status_code != 200:
+            return None
+        places = _response_json(response)
+    except (requests.RequestException, ValueError):
+        return None
+
+    if not isinstance(places, list):
+        return None
+    found_ids = {place.get("id") for place in places if isinstance(place, dict)}
+
+    # A response listing places we didn't ask for isn't answering this query, so don't act on it
+    if not found_ids <= set(place_ids):
+        return None
+    return found_ids
+
+def _build_status_dispatch(notFoundAction: str, internalServerErrorAction: str, successAction: str, dry_run: bool = False) -> Dict[int, Callable[[int], str]]:
+    """Map each handled status code straight to its action handler, built once per scan.
+
+    Raises:
+        ValueError: If an action isn't one of 'd', 'u' or 's'
+    """
+    if not _NONINTERACTIVE_ACTIONS.issuperset((notFoundAction, internalServerErrorAction, successAction)):
+        raise ValueError("Invalid actions specified.")
+    dispatch = _NONINTERACTIVE_DRY_RUN_DISPATCH if dry_run else _NONINTERACTIVE_DISPATCH
+    return {
+        404: dispatch[notFoundAction],
+        500: dispatch[internalServerErrorAction],
+        200: dispatch[successAction],
+    }
+
+def _process_place_noninteractive(place_id: int, status_dispatch: Dict[int, Callable[[int], str]], known_status_code: Optional[int] = None) -> str:
+    """Process a single place by ID in non-interactive mode and describe the outcome.
+
+    known_status_code skips the per-ID GET when the status is already known (e.g. 200 from a bulk lookup)."""
 
+    try:
+        if known_status_code is not None:
+            status_code = known_status_code
+        else:
+            status_code = backendClient.get_place_by_id(place_id).status_code
+            # A 500 may be transient (it isn't retried), so look again before acting on it
+            if status_code == 500:
+                status_code = backendClient.get_place_by_id(place_id).status_code
 
-def _process_place_noninteractive(place_id: int, notFoundAction: str, internalServerErrorAction: str, successAction: str) -> None:
-    """Process a single place by ID in non-interactive mode."""
-    
-    print("Non-interactive mode is currently disabled. Please use interactive mode.")
-    # allowed_actions = ['d', 'u', 's']
-    # if notFoundAction not in allowed_actions or internalServerErrorAction not in allowed_actions or successAction not in allowed_actions:
-    #     print(f"Invalid actions specified.")
-    #     return
-
-    # try:
-    #     place_response = _get_place_by_id(place_id)
-    #     status_code = place_response.status_code
-
-    #     if status_code == 404:
-    #         if notFoundAction == 'd':
-    #             _delete_place(place_id)
-    #         elif notFoundAction == 'u':
-    #             _update_place(place_id, place_data={})
-    #         return
-
-    #     elif status_code == 500:
-    #         if internalServerErrorAction == 'd':
-    #             _delete_place(place_id)
-    #         elif internalServerErrorAction == 'u':
-    #             _update_place(place_id, place_data={})
-    #         return
-
-    #     elif status_code == 200:
-    #         if successAction == 'd':
-    #             _delete_place(place_id)
-    #         elif successAction == 'u':
-    #             _update_place(place_id, place_data={})
-    #         return
-
-    # except Exception as e:
-    #     print(f"An error occurred while processing place ID {place_id}: {e}")
+        handler = status_dispatch.get(status_code)
+        if handler is not None:
+            return handler(place_id)
+
+        return f"Place ID {place_id} returned {status_code}, no action taken"
+
+    except CircuitOpenError:
+        raise
+    except Exception as e:
+        return f"An error occurred while processing place ID {place_id}: {e}"
+
+def _print(message: str) -> None:
+    """Print a whole message at once, so output from concurrent workers doesn't interleave mid-line."""
+    with _print_lock:
+        print(message)
+
+def _post_files_concurrently(post_file: Callable[[str], None], directory: str) -> None:
+    """Post every .json file under a directory, overlapping the file reads and backend round trips."""
+    with ThreadPoolExecutor(max_workers=POST_FILE_WORKERS) as executor:
+        # Workers start on the first files while the rest of the tree is still being walked
+        futures = {executor.submit(post_file, path): path for path in iter_json_paths(directory)}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                _print(f"An error occurred while posting {futures[future]}: {e}")
+
+def _read_action(prompt: str, allowed_actions: List[str]) -> str:
+    """Prompt until the user enters one of the allowed single-letter actions, and return it."""
+    allowed: frozenset = frozenset(allowed_actions)
+    action = input(prompt).strip().lower()
+    while action not in allowed:
+        action = input(f"Invalid action. Please enter {', '.join(repr(a) for a in allowed_actions)}: ").strip().lower()
+    return action
+
+def _read_status_actions() -> Tuple[str, str, str]:
+    """Read the non-interactive action for 404, 500 and 200 responses, all up front."""
+    choices = sorted(_NONINTERACTIVE_ACTIONS)
+    return cast(Tuple[str, str, str], tuple(
+        _read_action(f"Action on {status}? (d=delete, s=skip, u=update): ", choices)
+        for status in ("404 Not Found", "500 Internal Server Error", "200 Success")
+    ))
 
 def _process_place_interactive(place_id:int) -> None:
     """Main function to process a single place by ID."""
@@ -68,19 +203,19 @@ def _process_place_interactive(place_id:int) -> None:
             return
         
         elif status_code == 200:
-            os.system('cls' if os.name == 'nt' else 'clear')
-            print(f"Place ID {place_id} found. Current data:\n{place_response.json()}")
-
-            action = ''
-            while action not in ['d', 's']:
-                action = input("Action (delete 'd', skip 's'): ").strip().lower()
-                if action == 'd':
-                    backendClient.delete_place(place_id)
-                elif action == 's':
-                    print(f"Skipping place ID: {place_id}")
-                else:
-                    print("Invalid action. Please choose 'd', 'u', or 's'.")
-
+            # Clear the screen with an ANSI escape instead of spawning a 'cls'/'clear' process per place
+            if CLEAR_SCREEN_ENABLED:
+                print(CLEAR_SCREEN, end='', flush=True)
+            print(f"Place ID {place_id} found. Current data:\n{_response_json(place_response)}")
+
+            action = _read_action("Action (delete 'd', skip 's'): ", ['d', 's'])
+            if action == 'd':
+                backendClient.delete_place(place_id)
+            else:
+                print(f"Skipping place ID: {place_id}")
+
+    except CircuitOpenError:
+        raise
     except Exception as e:
         print(f"An error occurred while processing place ID {place_id}: {e}")
 
@@ -93,41 +228,90 @@ def process_existing_places() -> None:
 
         if (is_interactive):
             for place_id in range(start_id, end_id):
-                _process_place_interactive(place_id=place_id)
+                try:
+                    _process_place_interactive(place_id=place_id)
+                except CircuitOpenError as e:
+                    print(f"Stopping at place ID {place_id}: {e}")
+                    break
 
         else:
-            not_found_action = input("Action on 404 Not Found? (d=delete, s=skip, u=update): ").strip().lower()
-            while not_found_action not in ['d', 's', 'u']:
-                not_found_action = input("Invalid action. Please enter 'd', 's', or 'u': ").strip().lower()
+            # Read every action once, before the scan starts
+            not_found_action, internal_server_error_action, success_action = _read_status_actions()
 
-            internal_server_error_action = input("Action on 500 Internal Server Error? (d=delete, s=skip, u=update): ").strip().lower()
-            while internal_server_error_action not in ['d', 's', 'u']:
-                internal_server_error_action = input("Invalid action. Please enter 'd', 's', or 'u': ").strip().lower()
+            if not_found_action == internal_server_error_action == success_action == 's':
+                print("Skip chosen for every status, nothing to do.")
+                return
 
-            success_action = input("Action on 200 Success? (d=delete, s=skip, u=update): ").strip().lower()
-            while success_action not in ['d', 's', 'u']:
-                success_action = input("Invalid action. Please enter 'd', 's', or 'u': ").strip().lower()
-
-            for place_id in range(start_id, end_id):
-                _process_place_noninteractive(place_id=place_id, notFoundAction=not_found_action, internalServerErrorAction=internal_server_error_action, successAction=success_action)
+            # Destructive scans get a dry run or an explicit go-ahead first
+            dry_run = input("Dry run (report actions without sending them)? (y/n): ").strip().lower() == 'y'
+            if not dry_run and 'd' in (not_found_action, internal_server_error_action, success_action):
+                confirm = input(f"This may delete up to {max(end_id - start_id, 0)} places (IDs {start_id} to {end_id - 1}). Continue? (y/n): ")
+                if confirm.strip().lower() != 'y':
+                    print("Aborted, nothing was deleted.")
+                    return
+
+            # Deleting every ID regardless of status doesn't need the lookup, but only with an explicit go-ahead.
+            # Updates always look up first, so IDs that don't exist aren't sent a PUT.
+            skip_lookup = False
+            if not dry_run and not_found_action == internal_server_error_action == success_action == 'd':
+                confirm = input(f"Delete all {max(end_id - start_id, 0)} IDs without looking each one up first? (y/n): ")
+                skip_lookup = confirm.strip().lower() == 'y'
+
+            status_dispatch = _build_status_dispatch(not_found_action, internal_server_error_action, success_action, dry_run=dry_run)
+
+            # Scan in chunks: one bulk request finds the places that exist, and only the rest need a per-ID GET
+            # (to tell 404 from 500). Per-ID work runs concurrently over the client's pooled session.
+            place_ids = list(range(start_id, end_id))
+            with ThreadPoolExecutor(max_workers=NONINTERACTIVE_WORKERS) as executor:
+                for chunk_start in range(0, len(place_ids), ID_SCAN_CHUNK_SIZE):
+                    chunk = place_ids[chunk_start:chunk_start + ID_SCAN_CHUNK_SIZE]
+                    existing_ids = set(chunk) if skip_lookup else (_existing_place_ids(chunk) or set())
+                    futures = [
+                        executor.submit(_process_place_noninteractive, place_id, status_dispatch, 200 if place_id in existing_ids else None)
+                        for place_id in chunk
+                    ]
+                    # One console write per chunk rather than one per ID
+                    results: List[str] = []
+                    try:
+                        for future in as_completed(futures):
+                            results.append(future.result())
+                    except CircuitOpenError as e:
+                        # Backend is down: drop the queued IDs instead of failing each of them
+                        for future in futures:
+                            future.cancel()
+                        results.append(f"Stopping scan in chunk starting at place ID {chunk[0]}: {e}")
+                        print("\n".join(results))
+                        break
+                    print("\n".join(results))
 
     except KeyboardInterrupt:
         raise KeyboardInterrupt
     except Exception as e:
         print(f"An error occurred while processing existing places: {e}")
 
+def _write_place_file(filepath: str, place_data: Dict[str, Any]) -> None:
+    """Rewrite a cleaned place file atomically (temp file + rename), so an interrupted run never leaves it truncated."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(filepath)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(place_data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 def _post_nearbysearch_cleaned_data(filepath:str) -> None:
     """Post cleaned nearby search data to the backend."""
 
     # Given place data in a file, either update existing place or create new place in backend
 
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            place_data: Dict[str, Any] = json.load(f)
+        with open(filepath, "rb") as f:
+            place_data: Dict[str, Any] = orjson.loads(f.read())
             if not place_data: raise ValueError("No data found in file")
     except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {filepath}")
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Error decoding JSON from file {filepath}: {e}")
     except Exception as e:
         raise ValueError(f"Error getting data from file {filepath}: {e}")
@@ -142,45 +326,74 @@ def _post_nearbysearch_cleaned_data(filepath:str) -> None:
     )
 
     if (id_local is not None) and (id_backend is not None) and (id_local != id_backend):
-        print(f"Conflict: Local ID {id_local} does not match backend ID {id_backend}. Updating local ID.")
+        _print(f"Conflict: Local ID {id_local} does not match backend ID {id_backend}. Updating local ID.")
         place_data["id"] = id_backend
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(place_data, f, indent=2, ensure_ascii=False)
-            print(f"Updated local file with new ID {place_data['id']}.")
+        _write_place_file(filepath, place_data)
+        _print(f"Updated local file with new ID {place_data['id']}.")
 
         
     # 1) Place exists in backend by bounds, update it
     if id_backend:
-        print(f"Place ID {id_backend} already exists, updating place...")
+        _print(f"Place ID {id_backend} already exists, updating place...")
         response = backendClient.update_place(id_backend, place_data)
         if response.status_code == 200:
-            print(f"Successfully updated place ID {id_backend}\n({response.status_code}): {response.text}")
+            _print(f"Successfully updated place ID {id_backend}\n({response.status_code}): {_response_preview(response)}")
             return
         else:
-            print(f"Failed to update place ID {id_backend}\n({response.status_code}): {response.text}")
+            _print(f"Failed to update place ID {id_backend}\n({response.status_code}): {_response_preview(response)}")
             return
     
     # 2) Place does not exist in backend, create it
-    print(f"Place does not exist, creating place...")
+    _print(f"Place does not exist, creating place...")
     response = backendClient.create_place(place_data)
     if response.status_code == 201:
-        print(f"Successfully created place\n({response.status_code}): {response.text}")
-        if response.json().get("id") is not None: 
-            place_data["id"] = response.json().get("id")
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(place_data, f, indent=2, ensure_ascii=False)
-                print(f"Updated local file with new ID {place_data['id']}.")
+        _print(f"Successfully created place\n({response.status_code}): {_response_preview(response)}")
+        # Only rewrite the file if the backend's ID differs from the one it already holds
+        created_body: Any = _response_json(response)
+        created_id = created_body.get("id") if isinstance(created_body, dict) else None
+        if created_id is not None and created_id != id_local:
+            place_data["id"] = created_id
+            _write_place_file(filepath, place_data)
+            _print(f"Updated local file with new ID {place_data['id']}.")
     else:
-        print(f"Failed to create place ({response.status_code}):{response.text}")
+        _print(f"Failed to create place ({response.status_code}):{_response_preview(response)}")
         return
 
+def _is_valid_promo(promo_item: Any) -> bool:
+    """Check that a promoData item is a dictionary with the required fields."""
+    return isinstance(promo_item, dict) and all(key in promo_item for key in ("title", "description", "hours"))
+
+def _create_promos_bulk(place_id: int, promos: List[Dict[str, Any]], place_exists: bool) -> bool:
+    """Create all promos for a place in one bulk request.
+
+    Returns:
+        False if the promos should be created one by one instead (no bulk endpoint, or a 404), True once the
+        bulk request has succeeded or its failure has been reported
+    """
+    if backendClient.promotions_bulk_supported is False:
+        return False
+
+    response: requests.Response = backendClient.create_promotions_bulk(place_id, promos)
+    if _is_success(response):
+        backendClient.promotions_bulk_supported = True
+        _print(f"Created {len(promos)} promos for place ID {place_id}\n{DASH_RULE}\n({response.status_code}): {_response_preview(response)}")
+        return True
+    if response.status_code in BULK_UNSUPPORTED_STATUS_CODES or (response.status_code == 404 and place_exists):
+        backendClient.promotions_bulk_supported = False
+        return False
+    if response.status_code == 404:
+        # The place itself may be missing; per-promo requests report that for each promo
+        return False
+    _print(f"Failed to create {len(promos)} promos for place ID {place_id} ({response.status_code}):{_response_preview(response)}")
+    return True
+
 def _post_ai_cleaned_data(ai_data_filepath:str) -> None:
     """Post AI cleaned place data from specified file."""
 
     try:
 
-        with open(ai_data_filepath, "r", encoding="utf-8") as f:
-            data: Dict[str, Any] = json.load(f)
+        with open(ai_data_filepath, "rb") as f:
+            data: Dict[str, Any] = orjson.loads(f.read())
             if not data:
                 raise ValueError(f"No data found in file {ai_data_filepath}")
 
@@ -193,38 +406,47 @@ def _post_ai_cleaned_data(ai_data_filepath:str) -> None:
         if not place_id:
             raise ValueError(f"Missing 'id' in placeData of file {ai_data_filepath}")
             
-        update_place_response: requests.Response = backendClient.update_place(place_id, place_data)
-        print(f"Successfully updated place ID {place_id}\n{'-'*60}\n({update_place_response.status_code}): {update_place_response.text}")
-
+        # Validate the whole file before any request, so a malformed promo doesn't leave the place half-posted
         promotion_list_raw = data.get("promoData", None)
-        if promotion_list_raw is None:
-            print(f"No 'promoData' found in file {ai_data_filepath}")
-
-        else:
+        if promotion_list_raw is not None:
             if not isinstance(promotion_list_raw, list):
                 raise ValueError(f"'promoData' should be a list of dictionaries in file {ai_data_filepath}")
+            for promo_item in cast(List[Any], promotion_list_raw):
+                if not _is_valid_promo(promo_item):
+                    raise ValueError(f"Each item in 'promoData' should be a dictionary with 'title', 'description' and 'hours' in file {ai_data_filepath}")
 
-            promotion_list: List[Any] = cast(List[Any], promotion_list_raw)
-            for promo_item in promotion_list:
-                if not isinstance(promo_item, dict):
-                    raise ValueError(f"Each item in 'promoData' should be a dictionary in file {ai_data_filepath}")
-
-                promo_data: Dict[str, Any] = cast(Dict[str, Any], promo_item)
+        update_place_response: requests.Response = backendClient.update_place(place_id, place_data)
+        _print(f"Successfully updated place ID {place_id}\n{DASH_RULE}\n({update_place_response.status_code}): {_response_preview(update_place_response)}")
 
-                # Validate required fields in each promo dictionary
-                if "title" not in promo_data or "description" not in promo_data or "hours" not in promo_data:
-                    raise ValueError(f"Missing 'title', 'description' or 'hours' in promoData item in file {ai_data_filepath}")
+        if promotion_list_raw is None:
+            _print(f"No 'promoData' found in file {ai_data_filepath}")
 
-                # If all checks pass, create the promo
-                create_promo_response: requests.Response = backendClient.create_promotion(place_id=place_id, promo_data=promo_data)
-                print(f"Successfully created promo {promo_data['title']}\n{'-'*60}\n({create_promo_response.status_code}): {create_promo_response.text}")
+        else:
+            # All checks passed, so nothing malformed is sent; one bulk request when the backend supports it
+            promos: List[Dict[str, Any]] = cast(List[Dict[str, Any]], promotion_list_raw)
+            if promos and not _create_promos_bulk(place_id, promos, place_exists=_is_success(update_place_response)):
+                # Promos are independent, so create them concurrently over the pooled session
+                with ThreadPoolExecutor(max_workers=PROMO_WORKERS) as executor:
+                    futures = {
+                        executor.submit(backendClient.create_promotion, place_id=place_id, promo_data=promo_data): promo_data
+                        for promo_data in promos
+                    }
+                    # Printed together so this file's promos aren't interleaved with other files' output
+                    promo_results: List[str] = []
+                    for future in as_completed(futures):
+                        create_promo_response: requests.Response = future.result()
+                        if _is_success(create_promo_response):
+                            promo_results.append(f"Successfully created promo {futures[future]['title']}\n{DASH_RULE}\n({create_promo_response.status_code}): {_response_preview(create_promo_response)}")
+                        else:
+                            promo_results.append(f"Failed to create promo {futures[future]['title']} ({create_promo_response.status_code}):{_response_preview(create_promo_response)}")
+                    _print("\n".join(promo_results))
         
-        print(f"Finished processing AI cleaned data from file {ai_data_filepath}")
+        _print(f"Finished processing AI cleaned data from file {ai_data_filepath}")
 
     except ValueError as e:
-        print(f"Value Error processing AI cleaned data: {e}")
+        _print(f"Value Error processing AI cleaned data: {e}")
     except Exception as e:
-        print(f"Unexpected error processing AI cleaned data: {e}")
+        _print(f"Unexpected error processing AI cleaned data: {e}")
 
 def process_nearbysearch_data() ->  None:
     """Process nearby search cleaned data to be added to the database."""
@@ -232,14 +454,14 @@ def process_nearbysearch_data() ->  None:
         nearby_data_filepath = input("Enter nearby search cleaned data file path (or 'all' to specify all cleaned files in output directory: output_nearbySearch/): ").strip()
 
         if (nearby_data_filepath == 'all'):
-            for root, dirs, _ in os.walk("output_nearbySearch/"):
-                for dir in dirs:
-                    print(f"Processing directory: {dir}")
-                    subdirectory_path = os.path.join(root, dir)
-                    for subroot, _, subfiles in os.walk(subdirectory_path):
-                        for subfilename in subfiles:
-                            if subfilename.endswith(".json"):
-                                process_places(os.path.join(subroot, subfilename))
+            # Each subdirectory is walked once (files directly under output_nearbySearch/ are left alone, as before)
+            with os.scandir("output_nearbySearch/") as entries:
+                subdirectories = sorted((entry.name, entry.path) for entry in entries if entry.is_dir(follow_symlinks=False))
+            for dir, subdirectory_path in subdirectories:
+                print(f"Processing directory: {dir}")
+                # Unattended: places with missing fields are listed in a log rather than prompted for one by one
+                for path in iter_json_paths(subdirectory_path):
+                    process_places(path, interactive=False)
 
         else:
             process_places(nearby_data_filepath)
@@ -252,7 +474,7 @@ def process_nearbysearch_data() ->  None:
 def post_new_places() -> None:
     """Process new places to be added to the database."""
     try:
-        print(f"\nSelect the type of data to add\n'ns') nearby search cleaned data \n'ai') AI cleaned data \n'q') Cancel/Exit\n{'~' * 60}")
+        print(f"\nSelect the type of data to add\n'ns') nearby search cleaned data \n'ai') AI cleaned data \n'q') Cancel/Exit\n{TILDE_RULE}")
 
         type_of_data_option = ''
         while type_of_data_option not in ['ns', 'ai', 'q']:
@@ -263,10 +485,7 @@ def post_new_places() -> None:
                 nearby_data_filepath = input("Enter nearby search cleaned data file path (or 'all' to specify all cleaned files in output directory: output_nearbySearch_cleaned/): ").strip()
 
                 if (nearby_data_filepath == 'all'):
-                    for root, _, files in os.walk("output_nearbySearch_cleaned/"):
-                        for filename in files:
-                            if filename.endswith(".json"):
-                                _post_nearbysearch_cleaned_data(os.path.join(root, filename))
+                    _post_files_concurrently(_post_nearbysearch_cleaned_data, "output_nearbySearch_cleaned/")
 
                 else:
                     _post_nearbysearch_cleaned_data(nearby_data_filepath)
@@ -275,10 +494,7 @@ def post_new_places() -> None:
                 ai_data_filepath = input("Enter AI cleaned data file path (or 'all' to specify all AI cleaned files in output directory: output_nearbySearch_ai_cleaned/): ").strip()
 
                 if (ai_data_filepath == 'all'):
-                    for root, _, files in os.walk("output_nearbySearch_ai_cleaned/"):
-                        for filename in files:
-                            if filename.endswith(".json"):
-                                _post_ai_cleaned_data(os.path.join(root, filename))
+                    _post_files_concurrently(_post_ai_cleaned_data, "output_nearbySearch_ai_cleaned/")
                 else:
                     _post_ai_cleaned_data(ai_data_filepath)
 
@@ -296,11 +512,23 @@ def post_new_places() -> None:
 def main() -> None:
     """Main function to run the place data posting script."""
 
-    if (len(sys.argv) != 1):
-        print("Usage: python backend_CLI.py")
+    if (len(sys.argv) > 2) or (len(sys.argv) == 2 and sys.argv[1] != "--no-cache"):
+        print("Usage: python backend_CLI.py [--no-cache]")
         sys.exit(1)
 
-    print(f"Welcome to the Place Data CLI!\n{'~'*60}")
+    # Place responses from earlier runs are revalidated (If-None-Match / If-Modified-Since) rather than re-downloaded
+    use_place_cache = "--no-cache" not in sys.argv
+    if use_place_cache:
+        backendClient.load_place_cache(PLACE_CACHE_PATH)
+
+    # Windows consoles only interpret ANSI escapes (CLEAR_SCREEN) once VT processing is on; an empty system() call enables it
+    if os.name == 'nt':
+        os.system('')
+
+    print(f"Welcome to the Place Data CLI!\n{TILDE_RULE}")
+
+    # Connect while the user reads the menu, so the first action doesn't pay for DNS + handshake
+    threading.Thread(target=backendClient.warm_up, daemon=True).start()
 
     # Top level CLI interaction
     try:
@@ -308,7 +536,7 @@ def main() -> None:
               'pe') Process Existing, (interact with existing place data in backend)
               'pn') Post New, (add new place data to backend)
               'pns') Process Nearby Search, (interact with local nearby search data)
-              'q') Quit\n\n{'~'*60}\n""")
+              'q') Quit\n\n{TILDE_RULE}\n""")
 
         input_option = ''
         while input_option not in ['pe', 'pn', 'pns', 'q']:
@@ -332,6 +560,12 @@ def main() -> None:
     except KeyboardInterrupt:
         print("\nProcess interrupted by user. Shutting down gracefully.")
         sys.exit(0)
+    finally:
+        if use_place_cache:
+            try:
+                backendClient.save_place_cache(PLACE_CACHE_PATH)
+            except OSError as e:
+                print(f"Could not save place cache to {PLACE_CACHE_PATH}: {e}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
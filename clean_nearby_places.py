@@ -1,7 +1,9 @@
 import requests
 import os
+import re
 import json
 import sys
+import orjson
 from typing import Dict, List
 from dotenv import load_dotenv
 
@@ -12,6 +14,18 @@ from dotenv import load_dotenv
 load_dotenv()
 BACKEND_API_URL = os.getenv("BACKEND_API_URL")
 
+# Places skipped for missing fields in non-interactive runs, listed in the output directory
+MISSING_FIELDS_LOG = "missing_fields.log"
+
+# Google's generic types carry no information about the place, so they're dropped from secondary_types
+GENERIC_PLACE_TYPES = frozenset(("point_of_interest", "establishment"))
+
+# Characters not allowed in saved filenames: \w is exactly str.isalnum() plus '_', so unicode names keep their letters
+UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^\w \-]")
+
+# Google Places day index -> day name used by the backend
+DAY_NAMES: Dict[int, str] = {0: 'Sunday', 1: 'Monday', 2: 'Tuesday', 3: 'Wednesday', 4: 'Thursday', 5: 'Friday', 6: 'Saturday'}
+
 class GooglePlacesAPIError(Exception):
     """Custom exception for Google Places API errors."""
     pass
@@ -19,8 +33,8 @@ class GooglePlacesAPIError(Exception):
 def _get_nearby_places(filename:str) -> List[Dict]:
     """Fetch place data from local file."""
 
-    with open(filename, "r") as f:
-        places: List[Dict] = json.load(f)
+    with open(filename, "rb") as f:
+        places: List[Dict] = orjson.loads(f.read())
 
     return places
 
@@ -42,8 +56,9 @@ def _format_place_data(place_data:Dict) -> Dict:
     else: formatted_place_data["name"] = name
 
     # Coordinates (should always be present)
-    latitude: float = place_data.get("location", {}).get("latitude")
-    longitude: float = place_data.get("location", {}).get("longitude")
+    location: Dict = place_data.get("location", {})
+    latitude: float = location.get("latitude")
+    longitude: float = location.get("longitude")
     if latitude is None or longitude is None:
         missing_fields.append("latitude")
         missing_fields.append("longitude")
@@ -62,7 +77,7 @@ def _format_place_data(place_data:Dict) -> Dict:
     else: formatted_place_data["primary_type"] = primary_type
     secondary_types: List[str] = place_data.get("types")
     if secondary_types is None or len(secondary_types) == 0: missing_fields.append("secondary_types")
-    else: formatted_place_data["secondary_types"] = [t for t in secondary_types if t not in ["point_of_interest", "establishment"]]
+    else: formatted_place_data["secondary_types"] = [t for t in secondary_types if t not in GENERIC_PLACE_TYPES]
 
     # Rating
     rating = place_data.get("rating")
@@ -97,23 +112,24 @@ def _format_place_data(place_data:Dict) -> Dict:
     periods = place_data.get("regularOpeningHours", {}).get("periods", [])
     if periods is None or len(periods) == 0: missing_fields.append("hours")
     else:
-        day_map: Dict = {0: 'Sunday', 1: 'Monday', 2: 'Tuesday', 3: 'Wednesday', 4: 'Thursday', 5: 'Friday', 6: 'Saturday'}
         formatted_weekly_hours: List[Dict] = []
         for period in periods:
-            if period.get('open') is None or period.get('close') is None: raise(GooglePlacesAPIError("Invalid hours format from Google Places API"))
+            period_open: Dict = period.get('open')
+            period_close: Dict = period.get('close')
+            if period_open is None or period_close is None: raise(GooglePlacesAPIError("Invalid hours format from Google Places API"))
             else: 
-                day:int = period['open'].get('day')
-                open_hour:int = period['open'].get('hour')
-                open_minute:int = period['open'].get('minute')
+                day:int = period_open.get('day')
+                open_hour:int = period_open.get('hour')
+                open_minute:int = period_open.get('minute')
                 open_time:int = open_hour * 100 + open_minute
 
-                close_hour:int = period['close'].get('hour')
-                close_minute:int = period['close'].get('minute')
+                close_hour:int = period_close.get('hour')
+                close_minute:int = period_close.get('minute')
                 close_time:int = close_hour * 100 + close_minute
 
-                if day is not None and day in day_map:
+                if day is not None and day in DAY_NAMES:
                     formatted_weekly_hours.append({
-                        "day": day_map[day],
+                        "day": DAY_NAMES[day],
                         "open_hour": open_time,
                         "close_hour": close_time
                     })
@@ -169,8 +185,9 @@ def _post_nearby_places(places:List[Dict]) -> None:
         input("\n Press Enter to continue...")
 
 
-def _save_nearby_places(places: List[Dict]) -> None:
-    """Save formatted place data as individual JSON files."""
+def _save_nearby_places(places: List[Dict], interactive: bool = True) -> None:
+    """Save formatted place data as individual JSON files. Without interactive, places missing fields are
+    skipped and listed in MISSING_FIELDS_LOG instead of prompting."""
     
     output_dir = "output_nearbySearch_cleaned"
     
@@ -178,6 +195,9 @@ def _save_nearby_places(places: List[Dict]) -> None:
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
         print(f"Created output directory: {output_dir}")
+
+    # State subdirectories already checked, so each is stat'ed once per run rather than once per place
+    known_subdirectories = set()
     
     for i, place_data in enumerate(places, 1):
         print(f"Processing place {i} OF {len(places)}")
@@ -192,40 +212,47 @@ def _save_nearby_places(places: List[Dict]) -> None:
         formatted_place_data = _format_place_data(place_data=place_data)
         if formatted_place_data.get('missing_fields') is not None:
             print(f"Place {formatted_place_data.get('name', 'NO_NAME_FOUND')} is missing required fields: {formatted_place_data['missing_fields']}")
+            if not interactive:
+                with open(os.path.join(output_dir, MISSING_FIELDS_LOG), 'a', encoding='utf-8') as log:
+                    log.write(f"{formatted_place_data.get('name', 'NO_NAME_FOUND')} ({formatted_place_data.get('google_places_id')}): {', '.join(formatted_place_data['missing_fields'])}\n")
+                print(f"Skipped, listed in {MISSING_FIELDS_LOG}")
+                continue
             if input("Do you want to save this place data anyway? (y/n): ").lower() != 'y': continue
             del formatted_place_data['missing_fields']
 
         # Create filename from place name (sanitize for filesystem)
         place_name = formatted_place_data['name']
-        safe_filename = "".join(char for char in place_name if char.isalnum() or char in (' ', '-', '_')).rstrip()
+        safe_filename = UNSAFE_FILENAME_CHARS_RE.sub("", place_name).rstrip()
         safe_filename = safe_filename.replace(' ', '_')
         filename = f"{safe_filename}.json"
 
         # Create appropriate directory & subdirectories by state code
         subdirectory = formatted_place_data.get("state_code", "unknown_state")
         subdirectory_path = os.path.join(output_dir, subdirectory)
-        if not os.path.exists(subdirectory_path):
-            os.makedirs(subdirectory_path)
-            print(f"Created subdirectory: {subdirectory_path}")
+        if subdirectory_path not in known_subdirectories:
+            if not os.path.exists(subdirectory_path):
+                os.makedirs(subdirectory_path)
+                print(f"Created subdirectory: {subdirectory_path}")
+            known_subdirectories.add(subdirectory_path)
         filepath = os.path.join(subdirectory_path, filename)
 
         # Save the formatted place data to a JSON file
         print(f"Saving place {i}: {place_name} to {filename}")
         try:
-            with open(filepath, 'w') as f:
-                json.dump(formatted_place_data, f, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(formatted_place_data, option=orjson.OPT_INDENT_2))
             print(f"Successfully saved: {filename}")
         except Exception as e:
             print(f"Error saving place data: {e}")
 
 
-def process_places(filename: str):
+def process_places(filename: str, interactive: bool = True):
     """Main function to process places from a JSON file."""
     
     try:
         
         places = _get_nearby_places(filename)
-        _save_nearby_places(places)
+        _save_nearby_places(places, interactive=interactive)
 
     except FileNotFoundError:
         print(f"File not found: {filename}")
@@ -239,14 +266,17 @@ def process_places(filename: str):
 def main():
     """Main function to run the place data posting script."""
 
-    if len(sys.argv) != 2:
-        print("Usage: python script.py <json_file>")
+    args = sys.argv[1:]
+    interactive = "--yes" not in args
+    if not interactive: args.remove("--yes")
+    if len(args) != 1:
+        print("Usage: python script.py <json_file> [--yes]")
         sys.exit(1)
     
-    filename:str = sys.argv[1]
+    filename:str = args[0]
 
     try:
-        process_places(filename)
+        process_places(filename, interactive=interactive)
 
     except FileNotFoundError:
         print(f"File not found: {filename}")
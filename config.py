@@ -1,8 +1,9 @@
 """Configuration for params to Google Places API."""
+import itertools
 
 
 # Fields that trigger Pro SKU
-FIELD_MASK_TYPES_PRO = [
+FIELD_MASK_TYPES_PRO = (
     'addressComponents', 
     'adrFormatAddress', 
     'attributions', 
@@ -23,11 +24,11 @@ FIELD_MASK_TYPES_PRO = [
     'shortFormattedAddress',
     'types',
     # 'viewport'
-]
+)
 
 
 # Fields that trigger Enterprise SKU
-FIELD_MASK_TYPES_ENTERPRISE = [
+FIELD_MASK_TYPES_ENTERPRISE = (
     'currentOpeningHours', 
     'currentSecondaryOpeningHours', 
     'nationalPhoneNumber', 
@@ -38,11 +39,11 @@ FIELD_MASK_TYPES_ENTERPRISE = [
     'regularSecondaryOpeningHours', 
     'userRatingCount', 
     'websiteUri'
-]
+)
 
 
 # Fields that trigger Atmosphere SKU
-FIELD_MASK_TYPES_ATMOSPHERE = [
+FIELD_MASK_TYPES_ATMOSPHERE = (
     'allowsDogs', 
     'curbsidePickup', 
     'delivery', 
@@ -68,9 +69,9 @@ FIELD_MASK_TYPES_ATMOSPHERE = [
     'servesVegetarianFood', 
     'servesWine', 
     'takeout'
-]
+)
 # Combine wanted fields into a single field mask
-FIELD_MASK = ','.join(f'places.{t}' for t in (FIELD_MASK_TYPES_PRO + FIELD_MASK_TYPES_ENTERPRISE))
+FIELD_MASK = ','.join('places.' + t for t in itertools.chain(FIELD_MASK_TYPES_PRO, FIELD_MASK_TYPES_ENTERPRISE))
 
 
 # Types to request (max 41) from Table A types: https://developers.google.com/maps/documentation/places/web-service/place-types
@@ -4,12 +4,23 @@ Google Places API Data Fetcher (NEW)
 Fetches place data from Google Places NearbySearch API (NEW) through POST requests and saves to JSON.
 """
 
+import hashlib
 import json
 import logging
+import math
 import os
+import random
 import sys
-from typing import Dict, List, Optional, Any
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Any, Tuple
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
 from config import FIELD_MASK, INCLUDED_TYPES_FOOD_AND_DRINK
@@ -21,18 +32,97 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Search centers are snapped to a grid whose cells are at most this fraction of the search radius, so nearby
+# points share one (cached) search while the searched area moves by under 1% of its radius
+GRID_CELL_FRACTION_OF_RADIUS = 0.01
+METERS_PER_DEGREE = 111_000
+MAX_COORDINATE_DECIMALS = 7
+
+def _grid_decimals(radius: float) -> int:
+    """Decimal places to round search coordinates to for a given radius (in meters)."""
+    if radius <= 0:
+        return MAX_COORDINATE_DECIMALS
+    decimals = math.ceil(math.log10(METERS_PER_DEGREE / (radius * GRID_CELL_FRACTION_OF_RADIUS)))
+    return max(0, min(MAX_COORDINATE_DECIMALS, decimals))
+
+def _validate_search_params(latitude: float, longitude: float, radius: float, max_results: int) -> None:
+    """Reject search parameters the API would refuse, before spending a request (or quota) on them.
+
+    Raises:
+        ValueError: If a parameter is out of the API's accepted range
+    """
+    if not -90.0 <= latitude <= 90.0:
+        raise ValueError(f"latitude must be between -90 and 90, got {latitude}")
+    if not -180.0 <= longitude <= 180.0:
+        raise ValueError(f"longitude must be between -180 and 180, got {longitude}")
+    if not 0.0 < radius <= 50000.0:
+        raise ValueError(f"radius must be greater than 0 and at most 50000 meters, got {radius}")
+    if not 1 <= max_results <= 20:
+        raise ValueError(f"max_results must be between 1 and 20, got {max_results}")
+
+def _canonical_field_mask(field_mask: str) -> str:
+    """Field mask with entries deduplicated and sorted, so equivalent masks share one cache entry."""
+    fields = {f.strip() for f in field_mask.split(",") if f.strip()}
+    if "*" in fields:
+        return "*"
+    return ",".join(sorted(fields))
+
+def _field_mask_covers(cached_mask: str, requested_mask: str) -> bool:
+    """Whether a response fetched with cached_mask holds every field requested_mask asks for (both canonical)."""
+    if cached_mask == "*":
+        return True
+    return requested_mask != "*" and set(requested_mask.split(",")) <= set(cached_mask.split(","))
+
+def _project_places(places: List[Dict[str, Any]], field_mask: str) -> List[Dict[str, Any]]:
+    """Keep only the top-level place fields named by a (canonical, non-"*") field mask."""
+    keys = {f.split(".")[1] for f in field_mask.split(",") if f.startswith("places.")}
+    return [{k: v for k, v in place.items() if k in keys} for place in places]
+
+class _RateLimiter:
+    """Sliding-window limiter: blocks callers so at most max_requests start in any period (seconds)."""
+
+    __slots__ = ("max_requests", "period", "_timestamps", "_lock")
+
+    def __init__(self, max_requests: int, period: float = 60.0) -> None:
+        self.max_requests: int = max_requests
+        self.period: float = period
+        self._timestamps: deque = deque()
+        self._lock: threading.Lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Wait until a request may be sent within the window, then record it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._timestamps and self._timestamps[0] <= now - self.period:
+                    self._timestamps.popleft()
+                if len(self._timestamps) < self.max_requests:
+                    self._timestamps.append(now)
+                    return
+                wait = self._timestamps[0] + self.period - now
+            logger.info(f"Rate limit of {self.max_requests} requests/{self.period:.0f}s reached, waiting {wait:.1f}s")
+            time.sleep(wait)
+
 class PlacesFetcher:
     """Handles fetching and processing data from Google Places API."""
     
     OUTPUT_DIR = "output_nearbySearch"  # Desired Output Directory
+    MAX_CONCURRENT_FETCHES = 8  # Points fetched at once by fetch_and_save_many
+    CACHE_DIR = ".places_cache"  # Responses of earlier identical searches
+    CACHE_TTL_SECONDS = 24 * 60 * 60
+    CACHE_MAX_ENTRIES = 10_000  # Most recent cached searches kept when the cache is pruned at startup
+    DEFAULT_REQUESTS_PER_MINUTE = 600  # Nearby Search (New) default per-minute quota
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})  # Responses worth sending the search again for
+    MAX_BACKOFF_SECONDS = 30.0
+    BACKOFF_JITTER_SECONDS = 0.5
     NEARBY_SEARCH_URL = "https://places.googleapis.com/v1/places:searchNearby" # Docs: https://developers.google.com/maps/documentation/places/web-service/nearby-search
 
 
-    def __init__(self, api_key: Optional[str] = None) -> None:
-        """Initialize the PlacesFetcher.
+    def __init__(self, api_key: Optional[str] = None, use_cache: bool = True, max_retries: int = 5, backoff_factor: float = 0.5) -> None:
+        """Initialize the PlacesFetcher (use_cache=False always calls the API).
 
         Raises:
-            ValueError: If API key is not provided
+            ValueError: If API key is not provided, or PLACES_API_RPM isn't a positive integer
         """
         load_dotenv()
         api_key_value = api_key or os.getenv("GOOGLE_PLACES_API_KEY")
@@ -42,6 +132,140 @@ class PlacesFetcher:
                 "environment variable or pass api_key parameter."
             )
         self.api_key: str = api_key_value
+        self.use_cache: bool = use_cache
+        self.max_retries: int = max_retries
+        self.backoff_factor: float = backoff_factor
+        self._created_dirs: set = set()  # Output directories already ensured, so each is created once per run
+
+        # Shared by all fetch_and_save_many workers, so concurrent searches stay inside the per-minute quota
+        requests_per_minute = os.getenv("PLACES_API_RPM", str(self.DEFAULT_REQUESTS_PER_MINUTE))
+        if not requests_per_minute.strip().isdigit() or int(requests_per_minute) <= 0:
+            raise ValueError(f"PLACES_API_RPM must be a positive integer, got {requests_per_minute!r}")
+        self._rate_limiter: _RateLimiter = _RateLimiter(int(requests_per_minute))
+
+        # Shared session so repeated searches reuse the TLS connection to the API host instead of reconnecting
+        self._session: requests.Session = requests.Session()
+        self._session.headers.update({
+            "Content-Type": "application/json",
+            "X-Goog-Api-Key": self.api_key
+        })
+        # Only failed connections are retried here, since those never reached the API. Error responses are retried
+        # by _fetch_nearby_places, so each resend takes a rate limiter slot like any other request.
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=0,
+            status=0,
+            backoff_factor=backoff_factor,
+            backoff_max=self.MAX_BACKOFF_SECONDS,
+            backoff_jitter=self.BACKOFF_JITTER_SECONDS,
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retry)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        if self.use_cache:
+            self._prune_cache()
+
+    def __enter__(self) -> "PlacesFetcher":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """Seconds to wait before resending a search: the response's Retry-After if it gives one in seconds, else
+        capped, jittered exponential backoff."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0.0), self.MAX_BACKOFF_SECONDS)
+            except ValueError:
+                pass  # An HTTP date; fall back to backoff
+        delay = min(self.backoff_factor * (2 ** attempt), self.MAX_BACKOFF_SECONDS)
+        return delay + random.uniform(0, self.BACKOFF_JITTER_SECONDS)
+
+    def _cache_path(self, payload: Dict[str, Any]) -> str:
+        """Path of the cached response for this search; the order of included types doesn't matter.
+
+        The field mask is not part of the key: an entry records the mask it was fetched with, and serves any
+        search whose mask it covers.
+        """
+        key_fields: Dict[str, Any] = dict(payload, includedPrimaryTypes=sorted(payload["includedPrimaryTypes"]))
+        key = hashlib.sha256(json.dumps(key_fields, sort_keys=True).encode()).hexdigest()
+        return os.path.join(self.CACHE_DIR, f"{key}.json")
+
+    def _load_cached_places(self, cache_path: str, field_mask: str) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached places for a search, projected to field_mask, or None on a miss, an expired
+        entry, or an entry fetched with a mask that doesn't cover field_mask."""
+        try:
+            if time.time() - os.path.getmtime(cache_path) > self.CACHE_TTL_SECONDS:
+                return None
+            with open(cache_path, "rb") as f:
+                entry = orjson.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {cache_path}: {e}")
+            return None
+        # Entries written before field masks were recorded are plain lists; treat them as misses
+        if not isinstance(entry, dict) or not _field_mask_covers(entry.get("fieldMask", ""), field_mask):
+            return None
+        places: List[Dict[str, Any]] = entry.get("places", [])
+        if entry["fieldMask"] != field_mask:
+            places = _project_places(places, field_mask)
+        return places
+
+    def _store_cached_places(self, cache_path: str, places: List[Dict[str, Any]], field_mask: str) -> None:
+        """Write a search's places (and the mask they were fetched with) to the cache atomically, so
+        concurrent fetches never see a partial file."""
+        try:
+            os.makedirs(self.CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.CACHE_DIR, suffix=".tmp")
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry {cache_path}: {e}")
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps({"fieldMask": field_mask, "places": places}))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry {cache_path}: {e}")
+            os.unlink(tmp_path)
+
+    def _prune_cache(self) -> None:
+        """Delete expired cache entries (and expired temp files left by interrupted writes), then the oldest
+        entries beyond CACHE_MAX_ENTRIES."""
+        try:
+            with os.scandir(self.CACHE_DIR) as it:
+                entries = [(entry.stat().st_mtime, entry.path) for entry in it if entry.is_file()]
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning(f"Failed to prune cache {self.CACHE_DIR}: {e}")
+            return
+
+        expired_before = time.time() - self.CACHE_TTL_SECONDS
+        entries.sort(reverse=True)  # Newest first
+        kept = 0
+        for mtime, path in entries:
+            if mtime >= expired_before:
+                # Fresh temp files may belong to a write still in progress in another run
+                if not path.endswith(".json"):
+                    continue
+                if kept < self.CACHE_MAX_ENTRIES:
+                    kept += 1
+                    continue
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning(f"Failed to remove cache entry {path}: {e}")
 
     def _fetch_nearby_places(
             self,
@@ -66,14 +290,19 @@ class PlacesFetcher:
             List of place dictionaries
 
         Raises:
+            ValueError: If a search parameter is out of range
             requests.RequestException: If the API request fails
             json.JSONDecodeError: If response cannot be parsed
         """
-        headers: Dict[str, str] = {
-            "Content-Type": "application/json",
-            "X-Goog-Api-Key": self.api_key,
-            "X-Goog-FieldMask": field_mask
-        }
+        _validate_search_params(latitude, longitude, radius, max_results)
+
+        # Snap the center to the radius-dependent grid, for both the request and its cache key
+        decimals: int = _grid_decimals(radius)
+        latitude, longitude = round(latitude, decimals), round(longitude, decimals)
+
+        # Content type and API key are session defaults
+        field_mask = _canonical_field_mask(field_mask)
+        headers: Dict[str, str] = {"X-Goog-FieldMask": field_mask}
 
         payload: Dict[str, Any] = {
             "includedPrimaryTypes": included_types,
@@ -91,23 +320,50 @@ class PlacesFetcher:
             }
         }
 
-        response = requests.post(self.NEARBY_SEARCH_URL, headers=headers, json=payload)
+        # Identical searches within the TTL (asking for the same fields or a subset) are answered from disk
+        # instead of a paid API call
+        cache_path: str = self._cache_path(payload)
+        if self.use_cache:
+            cached = self._load_cached_places(cache_path, field_mask)
+            if cached is not None:
+                logger.info("Served nearby search from cache")
+                return cached
+
+        # Encoded with orjson rather than requests' stdlib json encoder (Content-Type is a session default)
+        body: bytes = orjson.dumps(payload)
+        # searchNearby is a read-only query, so it's safe to resend after a 429 or a server error
+        for attempt in range(self.max_retries + 1):
+            self._rate_limiter.acquire()
+            response = self._session.post(self.NEARBY_SEARCH_URL, headers=headers, data=body)
+            if response.status_code not in self.RETRY_STATUS_CODES or attempt == self.max_retries:
+                break
+            delay = self._retry_delay(response, attempt)
+            logger.warning(f"Nearby search returned {response.status_code}, retrying in {delay:.1f}s")
+            time.sleep(delay)
         response.raise_for_status()
-        data = response.json()
-        return data.get("places", [])
+        # orjson straight from the response bytes, rather than requests' decode-to-str + stdlib json
+        data: Dict[str, Any] = orjson.loads(response.content)
+        places: List[Dict[str, Any]] = data.get("places", [])
+        if self.use_cache:
+            self._store_cached_places(cache_path, places, field_mask)
+        return places
 
-    def _save_to_file(self, data: List[Dict[str, Any]], filename: str) -> None:
-        """Save data to JSON file.
+    def _save_to_file(self, data: List[Dict[str, Any]], filename: str, subdirectory: str = "") -> None:
+        """Save data to JSON file (in a subdirectory of OUTPUT_DIR, if given).
 
         Raises:
             IOError: If file cannot be written
         """
-        os.makedirs(self.OUTPUT_DIR, exist_ok=True)
-        full_path = os.path.join(self.OUTPUT_DIR, filename)
+        directory = os.path.join(self.OUTPUT_DIR, subdirectory)
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
+        full_path = os.path.join(directory, filename)
 
         try:
-            with open(full_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # orjson writes UTF-8 without escaping, matching the previous ensure_ascii=False output
+            with open(full_path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             logger.info(f"Data saved to {filename}")
         except IOError as e:
             logger.error(f"Failed to save data to {filename}: {e}")
@@ -133,6 +389,7 @@ class PlacesFetcher:
             field_mask: Fields to return in response
 
         Raises:
+            ValueError: If a search parameter is out of range
             requests.RequestException: If the API request fails
             json.JSONDecodeError: If response cannot be parsed
             IOError: If file cannot be written
@@ -153,31 +410,95 @@ class PlacesFetcher:
             return
 
         logger.info(f"Found {len(places)} places")
+        # Sharded by whole-degree cell so no single directory grows with the number of points fetched
         output_file = f"{latitude}-{longitude}.json"
-        self._save_to_file(data=places, filename=output_file)
+        shard = f"{math.floor(latitude)}_{math.floor(longitude)}"
+        self._save_to_file(data=places, filename=output_file, subdirectory=shard)
+
+    def fetch_and_save_many(self, points: List[Tuple[float, float]], **kwargs: Any) -> int:
+        """Fetch and save nearby places for several points concurrently.
+
+        Args:
+            points: (latitude, longitude) pairs
+            **kwargs: Passed to fetch_and_save_nearby_places for every point
+
+        Returns:
+            Number of points that failed (each failure is logged)
+        """
+        failures = 0
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_FETCHES) as executor:
+            futures = {
+                executor.submit(self.fetch_and_save_nearby_places, latitude=latitude, longitude=longitude, **kwargs): (latitude, longitude)
+                for latitude, longitude in points
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    failures += 1
+                    logger.error(f"Failed to fetch places near {futures[future]}: {e}")
+        return failures
+
+def _read_points_file(path: str) -> List[Tuple[float, float]]:
+    """Read 'latitude,longitude' lines from a file, skipping blank lines and '#' comments.
+
+    Raises:
+        ValueError: If a line isn't a latitude,longitude pair
+    """
+    points: List[Tuple[float, float]] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            fields = line.split(",")
+            if len(fields) != 2:
+                raise ValueError(f"{path}:{line_number}: expected 'latitude,longitude', got {line!r}")
+            points.append((round(float(fields[0]), 7), round(float(fields[1]), 7)))
+    return points
 
 def main() -> None:
     """Main function for CLI usage.
 
-    Usage: python filename.py <latitude> <longitude>
+    Usage: python filename.py <latitude> <longitude> [<latitude> <longitude> ...] [--points-file <file>] [--no-cache]
     """
-    if len(sys.argv) != 3:
-        print("Usage: python filename.py <latitude> <longitude>")
+    usage = "Usage: python filename.py <latitude> <longitude> [<latitude> <longitude> ...] [--points-file <file>] [--no-cache]"
+    args = sys.argv[1:]
+    use_cache = "--no-cache" not in args
+    if not use_cache:
+        args.remove("--no-cache")
+
+    points: List[Tuple[float, float]] = []
+    if "--points-file" in args:
+        index = args.index("--points-file")
+        if index + 1 >= len(args):
+            print(usage)
+            sys.exit(1)
+        try:
+            points = _read_points_file(args[index + 1])
+        except (OSError, ValueError) as e:
+            logger.error(f"Error reading points file: {e}")
+            sys.exit(1)
+        del args[index:index + 2]
+
+    if len(args) % 2 != 0 or not (args or points):
+        print(usage)
         sys.exit(1)
 
-    lat_rounded = round(float(sys.argv[1]), 7)
-    lon_rounded = round(float(sys.argv[2]), 7)
+    coordinates = [round(float(arg), 7) for arg in args]
+    points.extend(zip(coordinates[0::2], coordinates[1::2]))
 
     try:
-        fetcher = PlacesFetcher()
-        fetcher.fetch_and_save_nearby_places(
-            latitude=lat_rounded,
-            longitude=lon_rounded,
-            radius=5000.0,
-            included_types=INCLUDED_TYPES_FOOD_AND_DRINK,
-            max_results=20,
-            field_mask=FIELD_MASK,
-        )
+        with PlacesFetcher(use_cache=use_cache) as fetcher:
+            failures = fetcher.fetch_and_save_many(
+                points,
+                radius=5000.0,
+                included_types=INCLUDED_TYPES_FOOD_AND_DRINK,
+                max_results=20,
+                field_mask=FIELD_MASK,
+            )
+        if failures:
+            sys.exit(1)
     except KeyboardInterrupt:
         logger.info("Operation cancelled by user")
         sys.exit(0)